@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 from e6data_python_connector.common import get_ssl_credentials
 from e6data_python_connector.strategy import _get_active_strategy, _set_active_strategy, _set_pending_strategy, \
-    _get_grpc_header
+    _get_grpc_header, _get_grpc_header_tuple
 
 
 class _StatusLock:
@@ -219,12 +219,12 @@ class ClusterManager:
                 if request_type == "status":
                     response = self._get_connection.status(
                         payload,
-                        metadata=_get_grpc_header(cluster=self.cluster_uuid, strategy=current_strategy)
+                        metadata=_get_grpc_header_tuple(cluster=self.cluster_uuid, strategy=current_strategy)
                     )
                 elif request_type == "resume":
                     response = self._get_connection.resume(
                         payload,
-                        metadata=_get_grpc_header(cluster=self.cluster_uuid, strategy=current_strategy)
+                        metadata=_get_grpc_header_tuple(cluster=self.cluster_uuid, strategy=current_strategy)
                     )
                 else:
                     raise ValueError(f"Unknown request type: {request_type}")
@@ -254,12 +254,12 @@ class ClusterManager:
                         if request_type == "status":
                             response = self._get_connection.status(
                                 payload,
-                                metadata=_get_grpc_header(cluster=self.cluster_uuid, strategy=alternative_strategy)
+                                metadata=_get_grpc_header_tuple(cluster=self.cluster_uuid, strategy=alternative_strategy)
                             )
                         elif request_type == "resume":
                             response = self._get_connection.resume(
                                 payload,
-                                metadata=_get_grpc_header(cluster=self.cluster_uuid, strategy=alternative_strategy)
+                                metadata=_get_grpc_header_tuple(cluster=self.cluster_uuid, strategy=alternative_strategy)
                             )
 
                         # Update active strategy since the alternative worked
@@ -300,12 +300,12 @@ class ClusterManager:
                 if request_type == "status":
                     response = self._get_connection.status(
                         payload,
-                        metadata=_get_grpc_header(cluster=self.cluster_uuid, strategy=strategy)
+                        metadata=_get_grpc_header_tuple(cluster=self.cluster_uuid, strategy=strategy)
                     )
                 elif request_type == "resume":
                     response = self._get_connection.resume(
                         payload,
-                        metadata=_get_grpc_header(cluster=self.cluster_uuid, strategy=strategy)
+                        metadata=_get_grpc_header_tuple(cluster=self.cluster_uuid, strategy=strategy)
                     )
                 else:
                     raise ValueError(f"Unknown request type: {request_type}")
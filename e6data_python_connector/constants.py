@@ -35,12 +35,16 @@ ZONE = pytz.timezone('UTC')
 # Retry and timeout constants
 MAX_RETRY_ATTEMPTS = 5
 RETRY_SLEEP_SECONDS = 0.2
+MAX_RETRY_SLEEP_SECONDS = 2  # Cap for exponential backoff between retries
 STRATEGY_CACHE_TIMEOUT_SECONDS = 300  # 5 minutes
 DEFAULT_GRPC_PREPARE_TIMEOUT_SECONDS = 600  # 10 minutes
 DEFAULT_AUTO_RESUME_TIMEOUT_SECONDS = 300  # 5 minutes
 CLUSTER_STATUS_CHECK_SLEEP_SECONDS = 5
 LOCK_TIMEOUT_MS = 500
 
+# Result fetch constants
+DEFAULT_PREFETCH_BATCHES = 1  # Result batches requested ahead of the consumer
+
 # Connection pool constants
 POOL_GET_TIMEOUT_SECONDS = 0.1
 POOL_RETRY_SLEEP_SECONDS = 0.1
@@ -440,17 +440,32 @@ class FieldInfo:
         return self.name
 
 
+def _read_utf_from(view, offset):
+    utf_length = struct.unpack_from('>H', view, offset)[0]
+    offset += 2
+    return str(view[offset:offset + utf_length], 'utf-8'), offset + utf_length
+
+
 def get_query_columns_info(buffer):
-    result_meta_bytes = DataInputStream(buffer)
-    rowcount = result_meta_bytes.read_long()
-    field_count = result_meta_bytes.read_int()
+    """
+    Parse a ``resultMetaData`` payload into the row count and the result column descriptions.
+
+    The payload (``bytes`` or ``memoryview``) is read in place with ``struct.unpack_from``
+    instead of being copied into a stream. File-like objects such as ``BytesIO`` are still
+    accepted and are read from their current position.
+    """
+    if hasattr(buffer, 'read'):
+        buffer = buffer.read()
+    view = memoryview(buffer)
+    rowcount, field_count = struct.unpack_from('>qi', view, 0)
+    offset = 12
     columns_description = list()
 
     for i in range(field_count):
-        name = result_meta_bytes.read_utf().decode()
-        field_type = result_meta_bytes.read_utf().decode()
-        zone = result_meta_bytes.read_utf().decode()
-        date_format = result_meta_bytes.read_utf().decode()
+        name, offset = _read_utf_from(view, offset)
+        field_type, offset = _read_utf_from(view, offset)
+        zone, offset = _read_utf_from(view, offset)
+        date_format, offset = _read_utf_from(view, offset)
         field_info = FieldInfo(name, field_type, date_format, zone)
         columns_description.append(field_info)
     return rowcount, columns_description
@@ -511,16 +526,19 @@ def read_values_from_array(query_columns_description: list, dis: DataInputStream
     return value_array
 
 
-def read_rows_from_chunk(query_columns_description: list, buffer):
+def read_columns_from_chunk(query_columns_description: list, buffer):
     """
-    Read rows from a Thrift-encoded chunk buffer.
+    Read columns from a Thrift-encoded chunk buffer.
+
+    The chunk is already column-major on the wire, so this keeps that layout
+    instead of transposing it into rows.
 
     Args:
         query_columns_description: List of column descriptions
         buffer: Thrift-encoded binary buffer
 
     Returns:
-        List of rows
+        List of columns, each a list of ``chunk.size`` values, or None if the chunk is empty
     """
     # Create a transport and protocol instance for deserialization
     transport = TTransport.TMemoryBuffer(buffer)
@@ -533,47 +551,197 @@ def read_rows_from_chunk(query_columns_description: list, buffer):
     if chunk.size <= 0:
         return None
 
-    rows = list()
     columns = list()
-
     for col, colName in enumerate(query_columns_description):
-        columns.append(get_column_from_chunk(chunk.vectors[col]))
+        column = get_column_from_chunk(chunk.vectors[col])
+        if len(column) != chunk.size:
+            # Rows are built by transposing the columns, so each must hold exactly chunk.size values
+            _logger.error("Column %s holds %s values for a chunk of %s rows", col, len(column), chunk.size)
+            column = column[:chunk.size] + ['Failed to parse.'] * (chunk.size - len(column))
+        columns.append(column)
+    return columns
+
+
+def _check_column_lengths(columns: list):
+    """Raise ``IndexError`` unless every column holds as many values as the first one."""
+    size = len(columns[0])
+    for column in columns:
+        if len(column) != size:
+            raise IndexError("result columns have unequal lengths ({} and {})".format(size, len(column)))
+
+
+def rows_from_columns(columns: list) -> list:
+    """
+    Transpose column lists (as returned by ``read_columns_from_chunk``) into rows.
+
+    Args:
+        columns: List of equally sized column value lists
+
+    Returns:
+        List of rows, each a list with one value per column
+
+    Raises:
+        IndexError: If the columns differ in length
+    """
+    if not columns:
+        return list()
+    # zip stops at the shortest column, so a length mismatch must not go unnoticed
+    _check_column_lengths(columns)
+    # zip/map transpose the columns in C instead of indexing every cell from Python
+    return list(map(list, zip(*columns)))
+
+
+def iter_rows_from_columns(columns: list):
+    """
+    Lazily transpose column lists into rows.
+
+    Unlike ``rows_from_columns`` no list of rows is built, so only the decoded columns
+    and the row currently being consumed are held in memory.
+
+    Args:
+        columns: List of equally sized column value lists
+
+    Yields:
+        list: One row, with one value per column
+
+    Raises:
+        IndexError: If the columns differ in length
+    """
+    if not columns:
+        return
+    _check_column_lengths(columns)
+    for row in zip(*columns):
+        yield list(row)
+
+
+def read_rows_from_chunk_iter(query_columns_description: list, buffer):
+    """
+    Read rows from a Thrift-encoded chunk buffer one at a time.
+
+    Args:
+        query_columns_description: List of column descriptions
+        buffer: Thrift-encoded binary buffer
+
+    Yields:
+        list: One row of the chunk; nothing if the chunk is empty
+    """
+    columns = read_columns_from_chunk(query_columns_description, buffer)
+    if columns is None:
+        return
+    yield from iter_rows_from_columns(columns)
+
+
+def read_rows_from_chunk(query_columns_description: list, buffer):
+    """
+    Read rows from a Thrift-encoded chunk buffer.
+
+    Args:
+        query_columns_description: List of column descriptions
+        buffer: Thrift-encoded binary buffer
+
+    Returns:
+        List of rows
+    """
+    columns = read_columns_from_chunk(query_columns_description, buffer)
+    if columns is None:
+        return None
+    return rows_from_columns(columns)
+
+
+def _constant_column(vector: Vector, read_value, type_name=None) -> list:
+    """
+    Build the column of a constant vector, decoding its single value once.
+
+    ``read_value`` is only called when the constant is not null. If ``type_name`` is given,
+    a decode failure is logged and yields ``'Failed to parse.'`` for every row, matching the
+    per-row handling of non-constant vectors; otherwise the exception propagates.
+    """
+    if vector.nullSet[0]:
+        return [None] * vector.size
+    try:
+        value = read_value()
+    except Exception as e:
+        if type_name is None:
+            raise
+        _logger.error("Failed to parse %s constant: %s", type_name, e)
+        value = 'Failed to parse.'
+    return [value] * vector.size
 
-    for rowIndex in range(chunk.size):
-        value = list()
-        for colIndex, colName in enumerate(query_columns_description):
-            value.append(columns[colIndex][rowIndex])
-        rows.append(value)
 
-    return rows
+def _apply_null_set(vector: Vector, data: list) -> list:
+    """
+    Return the first ``vector.size`` values of ``data`` with null rows replaced by None.
+
+    The null set is scanned once with C-level builtins; only columns that contain nulls are
+    rebuilt, in a single pass. Otherwise the decoded value list is returned as-is. If the
+    vector holds fewer values or null flags than its size, the rows it does hold are kept
+    and the missing tail is filled with ``'Failed to parse.'``.
+    """
+    size = vector.size
+    null_set = vector.nullSet
+    available = min(len(data), len(null_set))
+    if available < size:
+        _logger.error("get_column_from_chunk failed (vectorType=%s, parsed=%s/%s): vector is short",
+                      vector.vectorType, available, size)
+        values = [None if is_null else value for value, is_null in zip(data, null_set)]
+        values.extend(['Failed to parse.'] * (size - available))
+        return values
+    if len(data) > size:
+        data = data[:size]
+    if True in null_set:
+        return [None if is_null else value for value, is_null in zip(data, null_set)]
+    return data
+
+
+# Column types whose decoded values need no per-value conversion, mapped to the Data field
+# holding a constant vector's value and the Data field holding a non-constant vector's values.
+_PLAIN_COLUMN_FIELDS = {
+    VectorType.LONG: ('numericConstantData', 'int64Data'),
+    VectorType.INTEGER: ('numericConstantData', 'int32Data'),
+    VectorType.DOUBLE: ('numericDecimalConstantData', 'float64Data'),
+    VectorType.FLOAT: ('numericDecimalConstantData', 'float32Data'),
+    VectorType.BOOLEAN: ('boolConstantData', 'boolData'),
+    VectorType.STRING: ('varcharConstantData', 'varcharData'),
+    VectorType.BINARY: ('varcharConstantData', 'varcharData'),
+    VectorType.ARRAY: ('varcharConstantData', 'varcharData'),
+    VectorType.MAP: ('varcharConstantData', 'varcharData'),
+    VectorType.STRUCT: ('varcharConstantData', 'varcharData'),
+}
 
 
 def get_column_from_chunk(vector: Vector) -> list:
     value_array = list()
     d_type = vector.vectorType
+    size = vector.size
+    is_constant = vector.isConstantVector
+    null_set = vector.nullSet
     zone = pytz.UTC
     try:
-        if d_type == VectorType.LONG:
-            for row in range(vector.size):
-                if get_null(vector, row):
-                    value_array.append(None)
-                    continue
-                value_array.append(vector.data.int64Data.data[
-                                       row] if not vector.isConstantVector else vector.data.numericConstantData.data)
-        elif d_type == VectorType.DATE:
+        # Constant vectors carry one value for every row: decode it once. Non-constant vectors
+        # bind their value list and null set up front instead of resolving vector.data.* and
+        # get_null() on every row, and columns that need no per-value conversion apply the
+        # null set in bulk.
+        plain_fields = _PLAIN_COLUMN_FIELDS.get(d_type)
+        if plain_fields is not None:
+            constant_field, data_field = plain_fields
+            if is_constant:
+                return _constant_column(vector, lambda: getattr(vector.data, constant_field).data)
+            return _apply_null_set(vector, getattr(vector.data, data_field).data)
+        if d_type == VectorType.DATE:
             # Use the JDBC-parity formatter so years > 9999 emit "+YYYYY-MM-DD"
             # instead of raising. Per-row try/except keeps a single bad value
             # from truncating the column (which previously cascaded to an
             # IndexError in read_rows_from_chunk).
-            for row in range(vector.size):
-                if get_null(vector, row):
+            if is_constant:
+                return _constant_column(
+                    vector, lambda: format_iso_date_from_epoch_micros(vector.data.dateConstantData.data), 'DATE')
+            data = vector.data.dateData.data
+            for row in range(size):
+                if null_set[row]:
                     value_array.append(None)
                     continue
                 try:
-                    raw = (vector.data.dateData.data[row]
-                           if not vector.isConstantVector
-                           else vector.data.dateConstantData.data)
-                    value_array.append(format_iso_date_from_epoch_micros(raw))
+                    value_array.append(format_iso_date_from_epoch_micros(data[row]))
                 except Exception as e:
                     _logger.error("Failed to parse DATE row=%s: %s", row, e)
                     value_array.append('Failed to parse.')
@@ -581,120 +749,73 @@ def get_column_from_chunk(vector: Vector) -> list:
             # Default formatter knobs reproduce the prior datetime.isoformat
             # output ("YYYY-MM-DDTHH:MM:SS.sss+HH:MM"). See DATE branch above
             # for the rationale on per-row try/except.
-            for row in range(vector.size):
-                if get_null(vector, row):
+            if is_constant:
+                return _constant_column(
+                    vector,
+                    lambda: format_iso_datetime_from_epoch_micros(vector.data.timeConstantData.data, tz=zone),
+                    'DATETIME')
+            data = vector.data.timeData.data
+            for row in range(size):
+                if null_set[row]:
                     value_array.append(None)
                     continue
                 try:
-                    epoch_micros = (vector.data.timeData.data[row]
-                                    if not vector.isConstantVector
-                                    else vector.data.timeConstantData.data)
-                    value_array.append(format_iso_datetime_from_epoch_micros(epoch_micros, tz=zone))
+                    value_array.append(format_iso_datetime_from_epoch_micros(data[row], tz=zone))
                 except Exception as e:
                     _logger.error("Failed to parse DATETIME row=%s: %s", row, e)
                     value_array.append('Failed to parse.')
-        elif d_type == VectorType.STRING or d_type == VectorType.ARRAY or d_type == VectorType.MAP or d_type == VectorType.STRUCT:
-            for row in range(vector.size):
-                if get_null(vector, row):
-                    value_array.append(None)
-                    continue
-                value_array.append(vector.data.varcharData.data[
-                                       row] if not vector.isConstantVector else vector.data.varcharConstantData.data)
-        elif d_type == VectorType.DOUBLE:
-            for row in range(vector.size):
-                if get_null(vector, row):
-                    value_array.append(None)
-                    continue
-                value_array.append(vector.data.float64Data.data[
-                                       row] if not vector.isConstantVector else vector.data.numericDecimalConstantData.data)
-        elif d_type == VectorType.BINARY:
-            for row in range(vector.size):
-                if get_null(vector, row):
-                    value_array.append(None)
-                    continue
-                value_array.append(vector.data.varcharData.data[
-                                       row] if not vector.isConstantVector else vector.data.varcharConstantData.data)
-        elif d_type == VectorType.FLOAT:
-            for row in range(vector.size):
-                if get_null(vector, row):
-                    value_array.append(None)
-                    continue
-                value_array.append(vector.data.float32Data.data[
-                                       row] if not vector.isConstantVector else vector.data.numericDecimalConstantData.data)
-        elif d_type == VectorType.BOOLEAN:
-            for row in range(vector.size):
-                if get_null(vector, row):
-                    value_array.append(None)
-                    continue
-                value_array.append(vector.data.boolData.data[
-                                       row] if not vector.isConstantVector else vector.data.boolConstantData.data)
-        elif d_type == VectorType.INTEGER:
-            for row in range(vector.size):
-                if get_null(vector, row):
-                    value_array.append(None)
-                    continue
-                value_array.append(vector.data.int32Data.data[
-                                       row] if not vector.isConstantVector else vector.data.numericConstantData.data)
         elif d_type == VectorType.NULL:
-            for row in range(vector.size):
-                value_array.append(None)
+            value_array = [None] * size
         elif d_type == VectorType.TIMESTAMP_TZ:
             # row_zone is scoped to the row (not the outer `zone`) so a
             # per-row zone resolution doesn't leak into later iterations.
-            for row in range(vector.size):
-                if get_null(vector, row):
+            if is_constant:
+                constant_data = vector.data.timeConstantData
+                return _constant_column(
+                    vector,
+                    lambda: format_iso_datetime_from_epoch_micros(
+                        constant_data.data,
+                        tz=zone if constant_data.zoneData is None else timezone_from_offset(constant_data.zoneData)),
+                    'TIMESTAMP_TZ')
+            data = vector.data.timeData.data
+            zone_data = vector.data.timeData.zoneData
+            for row in range(size):
+                if null_set[row]:
                     value_array.append(None)
                     continue
                 try:
-                    epoch_micros = (vector.data.timeData.data[row]
-                                    if not vector.isConstantVector
-                                    else vector.data.timeConstantData.data)
                     row_zone = zone
-                    if ((vector.isConstantVector and vector.data.timeConstantData.zoneData is not None) or
-                            (not vector.isConstantVector and vector.data.timeData.zoneData is not None)):
-                        zone_id = (vector.data.timeData.zoneData[row]
-                                   if not vector.isConstantVector
-                                   else vector.data.timeConstantData.zoneData)
-                        row_zone = timezone_from_offset(zone_id)
-                    value_array.append(format_iso_datetime_from_epoch_micros(epoch_micros, tz=row_zone))
+                    if zone_data is not None:
+                        row_zone = timezone_from_offset(zone_data[row])
+                    value_array.append(format_iso_datetime_from_epoch_micros(data[row], tz=row_zone))
                 except Exception as e:
                     _logger.error("Failed to parse TIMESTAMP_TZ row=%s: %s", row, e)
                     value_array.append('Failed to parse.')
         elif d_type == VectorType.DECIMAL128:
             # Handle both constant and non-constant vectors following Java implementation
-            if vector.isConstantVector:
+            if is_constant:
                 # For constant vectors, get the binary data and convert it once
                 binary_data = vector.data.numericDecimal128ConstantData.data
                 # Get scale with backward compatibility for older engines
                 scale = getattr(vector.data.numericDecimal128ConstantData, 'scale', None)
 
-                # Convert binary data to BigDecimal equivalent
-                if binary_data:
-                    decimal_value = _binary_to_decimal128(binary_data, scale)
-                else:
-                    decimal_value = Decimal('0')
-
-                # Apply the same value to all rows
-                for row in range(vector.size):
-                    if get_null(vector, row):
-                        value_array.append(None)
-                    else:
-                        value_array.append(decimal_value)
+                # Convert binary data to BigDecimal equivalent and apply the same value to all rows
+                return _constant_column(
+                    vector, lambda: _binary_to_decimal128(binary_data, scale) if binary_data else Decimal('0'))
             else:
                 # For non-constant vectors, process each row individually
                 # Get scale from decimal128Data (with backward compatibility)
                 scale = getattr(vector.data.decimal128Data, 'scale', None)
+                data = vector.data.decimal128Data.data
 
-                for row in range(vector.size):
-                    if get_null(vector, row):
+                for row in range(size):
+                    if null_set[row]:
                         value_array.append(None)
                         continue
                     # Get binary data for this row
-                    binary_data = vector.data.decimal128Data.data[row]
-                    decimal_value = _binary_to_decimal128(binary_data, scale)
-                    value_array.append(decimal_value)
+                    value_array.append(_binary_to_decimal128(data[row], scale))
         else:
-            value_array.append(None)
+            value_array = [None] * size
     except Exception as e:
         # Safety net: if anything escapes the per-row try/excepts above (or
         # comes from a branch without one), pad value_array to vector.size so
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Final
 import pytz
 
@@ -251,6 +252,18 @@ def _tz_offset_minutes(tz, ref_seconds=0):
     return 0
 
 
+@lru_cache(maxsize=4096)
+def _format_iso_date_from_days(days):
+    """
+    Render days since 1970-01-01 as an ISO-8601 date string.
+
+    Memoized: a result chunk usually spans only a handful of distinct days, so the
+    calendar conversion and formatting run once per day rather than once per row.
+    """
+    y, mo, d = _civil_from_days(days)
+    return "{}-{:02d}-{:02d}".format(_format_iso_year(y), mo, d)
+
+
 def format_iso_date_from_epoch_micros(epoch_micros):
     """
     Format epoch microseconds (UTC) as an ISO-8601 date string with Java
@@ -272,9 +285,7 @@ def format_iso_date_from_epoch_micros(epoch_micros):
         str: ISO-8601 date. Years 0-9999 unprefixed, others with '+' / '-'.
     """
     epoch_seconds = floor_div(epoch_micros, 1_000_000)
-    days = floor_div(epoch_seconds, _SECONDS_PER_DAY)
-    y, mo, d = _civil_from_days(days)
-    return "{}-{:02d}-{:02d}".format(_format_iso_year(y), mo, d)
+    return _format_iso_date_from_days(floor_div(epoch_seconds, _SECONDS_PER_DAY))
 
 
 def format_iso_datetime_from_epoch_micros(epoch_micros, tz=None, separator='T',
@@ -316,12 +327,10 @@ def format_iso_datetime_from_epoch_micros(epoch_micros, tz=None, separator='T',
     micros_of_second = floor_mod(local_micros, 1_000_000)
     days = floor_div(epoch_seconds, _SECONDS_PER_DAY)
     sec_of_day = floor_mod(epoch_seconds, _SECONDS_PER_DAY)
-    y, mo, d = _civil_from_days(days)
     h = sec_of_day // 3600
     mi = (sec_of_day % 3600) // 60
     s = sec_of_day % 60
-    out = "{}-{:02d}-{:02d}{}{:02d}:{:02d}:{:02d}".format(
-        _format_iso_year(y), mo, d, separator, h, mi, s)
+    out = "{}{}{:02d}:{:02d}:{:02d}".format(_format_iso_date_from_days(days), separator, h, mi, s)
     if include_millis:
         out += ".{:03d}".format(micros_of_second // 1000)
     if include_offset:
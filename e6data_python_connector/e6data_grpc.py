@@ -6,30 +6,38 @@ Many docstrings in this file are based on the PEP, which is in the public domain
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import asyncio
+import collections
 import datetime
+import functools
+import itertools
 import logging
 import os
 import re
-import sys
 import threading
 import time
 from decimal import Decimal
-from io import BytesIO
+from operator import attrgetter
 from ssl import CERT_NONE, CERT_OPTIONAL, CERT_REQUIRED
 
 import grpc
+from google.protobuf.internal import api_implementation
 from grpc._channel import _InactiveRpcError
 
 from e6data_python_connector.cluster_manager import ClusterManager
 from e6data_python_connector.common import DBAPITypeObject, ParamEscaper, DBAPICursor, get_ssl_credentials
 from e6data_python_connector.constants import (
-    MAX_RETRY_ATTEMPTS, RETRY_SLEEP_SECONDS, GRPC_ERROR_STRATEGY_MISMATCH, GRPC_ERROR_ACCESS_DENIED,
-    PRIMITIVE_TYPES
+    MAX_RETRY_ATTEMPTS, RETRY_SLEEP_SECONDS, MAX_RETRY_SLEEP_SECONDS, GRPC_ERROR_STRATEGY_MISMATCH,
+    GRPC_ERROR_ACCESS_DENIED, PRIMITIVE_TYPES, DEFAULT_PREFETCH_BATCHES
+)
+from e6data_python_connector.datainputstream import get_query_columns_info, read_columns_from_chunk, \
+    rows_from_columns, iter_rows_from_columns, is_fastbinary_available
+# DB-API exceptions are part of the module interface (PEP 249)
+from e6data_python_connector.exceptions import (
+    Error, InterfaceError, DatabaseError, NotSupportedError, ProgrammingError, DataError, OperationalError
 )
-from e6data_python_connector.datainputstream import get_query_columns_info, read_rows_from_chunk, \
-    is_fastbinary_available
 from e6data_python_connector.server import e6x_engine_pb2_grpc, e6x_engine_pb2
-from e6data_python_connector.strategy import _get_grpc_header
+from e6data_python_connector.strategy import _get_grpc_header_tuple
 from e6data_python_connector.typeId import *
 
 apilevel = '2.0'
@@ -37,6 +45,29 @@ threadsafety = 2  # Threads may share the e6xdb and connections.
 paramstyle = 'pyformat'  # Python extended format codes, e.g. ...WHERE name=%(name)s
 
 _TIMESTAMP_PATTERN = re.compile(r'(\d+-\d+-\d+ \d+:\d+:\d+(\.\d{,6})?)')
+_CANONICAL_TIMESTAMP_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?')
+
+# Request messages and status codes bound once at import; these are looked up on every RPC.
+_AuthenticateRequest = e6x_engine_pb2.AuthenticateRequest
+_CancelQueryRequest = e6x_engine_pb2.CancelQueryRequest
+_ClearOrCancelQueryRequest = e6x_engine_pb2.ClearOrCancelQueryRequest
+_ClearRequest = e6x_engine_pb2.ClearRequest
+_DryRunRequest = e6x_engine_pb2.DryRunRequest
+_ExecuteStatementRequest = e6x_engine_pb2.ExecuteStatementRequest
+_ExecuteStatementV2Request = e6x_engine_pb2.ExecuteStatementV2Request
+_ExplainAnalyzeRequest = e6x_engine_pb2.ExplainAnalyzeRequest
+_ExplainRequest = e6x_engine_pb2.ExplainRequest
+_GetColumnsV2Request = e6x_engine_pb2.GetColumnsV2Request
+_GetNextResultBatchRequest = e6x_engine_pb2.GetNextResultBatchRequest
+_GetResultMetadataRequest = e6x_engine_pb2.GetResultMetadataRequest
+_GetSchemaNamesV2Request = e6x_engine_pb2.GetSchemaNamesV2Request
+_GetTablesV2Request = e6x_engine_pb2.GetTablesV2Request
+_PrepareStatementRequest = e6x_engine_pb2.PrepareStatementRequest
+_PrepareStatementV2Request = e6x_engine_pb2.PrepareStatementV2Request
+_StatusRequest = e6x_engine_pb2.StatusRequest
+_INTERNAL = grpc.StatusCode.INTERNAL
+_UNKNOWN = grpc.StatusCode.UNKNOWN
+_UNAVAILABLE = grpc.StatusCode.UNAVAILABLE
 
 ssl_cert_parameter_map = {
     "none": CERT_NONE,
@@ -45,8 +76,34 @@ ssl_cert_parameter_map = {
 }
 
 
+def _parse_canonical_timestamp(value, _match=_CANONICAL_TIMESTAMP_PATTERN.match):
+    """
+    Parse a zero-padded ``YYYY-MM-DD HH:MM:SS[.ffffff]`` value from the regex groups, without strptime.
+
+    Returns None when the value has any other shape, so the caller can fall back to the generic parser.
+    """
+    match = _match(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction = match.groups()
+    if fraction is None:
+        if match.end() != len(value):
+            return None
+        microsecond = 0
+    else:
+        # Like the generic pattern, keep at most six fractional digits and ignore anything after them
+        microsecond = int(fraction.ljust(6, '0'))
+    try:
+        return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond)
+    except ValueError:
+        return None
+
+
 def _parse_timestamp(value):
     if value:
+        parsed = _parse_canonical_timestamp(value)
+        if parsed is not None:
+            return parsed
         match = _TIMESTAMP_PATTERN.match(value)
         if match:
             if match.group(2):
@@ -70,32 +127,66 @@ TYPES_CONVERTER = {
     "TIMESTAMP_TYPE": _parse_timestamp
 }
 
+# Arrow type factory names for result field types whose decoded Python values map
+# one-to-one onto an Arrow type; other field types are left to Arrow's inference.
+ARROW_TYPES = {
+    "LONG": "int64",
+    "INTEGER": "int32",
+    "INT": "int32",
+    "SHORT": "int16",
+    "BYTE": "int8",
+    "DOUBLE": "float64",
+    "FLOAT": "float32",
+    "BOOLEAN": "bool_",
+}
+
+# NumPy dtypes for the same fixed-width result field types; other field types become object arrays.
+NUMPY_DTYPES = {
+    "LONG": "int64",
+    "INTEGER": "int32",
+    "INT": "int32",
+    "SHORT": "int16",
+    "BYTE": "int8",
+    "DOUBLE": "float64",
+    "FLOAT": "float32",
+    "BOOLEAN": "bool",
+}
+
 
 def re_auth(func):
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        max_retry = MAX_RETRY_ATTEMPTS
-        current_retry = 0
-        while current_retry < max_retry:
+        for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
             try:
                 return func(self, *args, **kwargs)
             except _InactiveRpcError as e:
-                current_retry += 1
-                if current_retry == max_retry:
+                if attempt == MAX_RETRY_ATTEMPTS:
                     raise e
-                if e.code() == grpc.StatusCode.INTERNAL and GRPC_ERROR_ACCESS_DENIED in e.details():
+                # details() builds a new string on every call, so read it once
+                details = e.details() or ''
+                if e.code() == _INTERNAL and GRPC_ERROR_ACCESS_DENIED in details:
                     time.sleep(RETRY_SLEEP_SECONDS)
                     self.connection.get_re_authenticate_session_id()
-                elif GRPC_ERROR_STRATEGY_MISMATCH in e.details():
+                    self._session_id = None
+                    self._invalidate_metadata()
+                elif GRPC_ERROR_STRATEGY_MISMATCH in details:
                     # Strategy changed, clear cache and retry
                     _clear_strategy_cache()
                     # Force re-authentication which will detect new strategy
                     self.connection.get_re_authenticate_session_id()
+                    self._session_id = None
+                    self._invalidate_metadata()
                 else:
                     raise e
 
     return wrapper
 
 
+# Bound search of the characters escape_string rewrites; a miss means the value is returned as-is
+_NEEDS_ESCAPE = re.compile(r"[\\'\r\n\t]").search
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', "'": "\\'", '\r': '\\r', '\n': '\\n', '\t': '\\t'})
+
+
 class HiveParamEscaper(ParamEscaper):
     def escape_string(self, item):
         # backslashes and single quotes need to be escaped
@@ -105,14 +196,10 @@ class HiveParamEscaper(ParamEscaper):
         # string formatting here.
         if isinstance(item, bytes):
             item = item.decode('utf-8')
-        return "'{}'".format(
-            item
-            .replace('\\', '\\\\')
-            .replace("'", "\\'")
-            .replace('\r', '\\r')
-            .replace('\n', '\\n')
-            .replace('\t', '\\t')
-        )
+        # Most parameters contain nothing to escape; otherwise translate them in a single C-level pass
+        if _NEEDS_ESCAPE(item) is None:
+            return "'" + item + "'"
+        return "'" + item.translate(_ESCAPE_TABLE) + "'"
 
 
 _escaper = HiveParamEscaper()
@@ -124,25 +211,61 @@ logger = logging.getLogger(__name__)
 _strategy_lock = threading.Lock()
 _strategy_manager = None
 _shared_strategy = None
+# Map of query_id to strategy used. Registration, lookup and cleanup are single dict operations,
+# which are atomic under the GIL, so they don't take _strategy_lock.
+_query_strategy_map = {}
 _local_strategy_cache = {
     'active_strategy': None,
     'last_check_time': 0,
     'pending_strategy': None,  # Strategy to use for next query
-    'query_strategy_map': {},  # Map of query_id to strategy used
+    'query_strategy_map': _query_strategy_map,  # Map of query_id to strategy used
     'last_transition_time': 0,  # Timestamp of last strategy transition
     'session_invalidated': False  # Flag to invalidate all sessions
 }
 
+# Immutable view of the strategy state for readers, republished by every writer while it holds
+# _strategy_lock. Strategy reads happen on every RPC while writes only happen on transitions, so
+# readers load this reference without taking the lock; rebinding a module global is atomic.
+_StrategyState = collections.namedtuple('_StrategyState', 'active pending last_check last_transition invalidated')
+_strategy_snapshot = _StrategyState(None, None, 0, 0, False)
+
 # Strategy cache timeout in seconds (5 minutes)
 STRATEGY_CACHE_TIMEOUT = 300
 
-# Global set to track debug-enabled connections
-_debug_connections = set()
+# Ids of debug-enabled connections. Readers check it on every debug log call without locking, so
+# writers publish a new frozenset under _debug_connections_lock instead of mutating it in place.
+_debug_connections = frozenset()
+_debug_connections_lock = threading.Lock()
+
+# display_size, internal_size, precision, scale and null_ok of every description entry
+_DESCRIPTION_TAIL = (None, None, None, None, True)
+
+# Reads (fieldName, fieldType) off a FieldInfo message in one C-level call
+_column_field_info = attrgetter('fieldName', 'fieldType')
 
-def _strategy_debug_log(message):
-    """Log strategy debug messages if any connection has debug enabled."""
+# Channels shared by connections created with the ``share_channels`` gRPC option. Keyed by target,
+# security settings and channel options; each entry is ``[channel, reference count]``.
+_shared_channels = {}
+_shared_channels_lock = threading.Lock()
+
+def _strategy_debug_log(message, *args):
+    """
+    Log strategy debug messages if any connection has debug enabled.
+
+    ``args`` are %-formatted into ``message`` by the logger, so nothing is formatted when debug is off.
+    """
     if _debug_connections:
-        logger.info(f"[E6DATA_STRATEGY_DEBUG] {time.strftime('%Y-%m-%d %H:%M:%S')} - {message}")
+        logger.info("[E6DATA_STRATEGY_DEBUG] %s - " + message, time.strftime('%Y-%m-%d %H:%M:%S'), *args)
+
+
+def _set_debug_connection(connection_id, enabled):
+    """Add or remove a connection from the debug-enabled set by publishing a new snapshot."""
+    global _debug_connections
+    with _debug_connections_lock:
+        if enabled:
+            _debug_connections = _debug_connections | {connection_id}
+        else:
+            _debug_connections = _debug_connections - {connection_id}
 
 
 def _get_shared_strategy():
@@ -150,17 +273,21 @@ def _get_shared_strategy():
     return _local_strategy_cache
 
 
+def _publish_strategy_snapshot(shared_strategy):
+    """Publish a copy of the strategy state for lock-free readers. Must be called with _strategy_lock held."""
+    global _strategy_snapshot
+    _strategy_snapshot = _StrategyState(
+        shared_strategy['active_strategy'],
+        shared_strategy['pending_strategy'],
+        shared_strategy['last_check_time'],
+        shared_strategy['last_transition_time'],
+        shared_strategy['session_invalidated'],
+    )
+
+
 def _get_active_strategy():
     """Get the active deployment strategy (blue or green) from shared memory."""
-    with _strategy_lock:
-        shared_strategy = _get_shared_strategy()
-        # current_time = time.time()
-        # Check if strategy is cached and not expired
-        # if (shared_strategy['active_strategy'] is not None and
-        #     current_time - shared_strategy['last_check_time'] < STRATEGY_CACHE_TIMEOUT):
-        if shared_strategy['active_strategy'] is not None:
-            return shared_strategy['active_strategy']
-        return None
+    return _strategy_snapshot.active
 
 
 def _set_active_strategy(strategy):
@@ -180,12 +307,13 @@ def _set_active_strategy(strategy):
         # Only update transition time if strategy actually changed
         if old_strategy != normalized_strategy:
             shared_strategy['last_transition_time'] = current_time
-            _strategy_debug_log(f"Setting active strategy: {old_strategy} -> {normalized_strategy}")
+            _strategy_debug_log("Setting active strategy: %s -> %s", old_strategy, normalized_strategy)
         else:
-            _strategy_debug_log(f"Active strategy unchanged: {normalized_strategy}")
+            _strategy_debug_log("Active strategy unchanged: %s", normalized_strategy)
 
         shared_strategy['active_strategy'] = normalized_strategy
         shared_strategy['last_check_time'] = current_time
+        _publish_strategy_snapshot(shared_strategy)
 
 
 def _clear_strategy_cache():
@@ -194,10 +322,11 @@ def _clear_strategy_cache():
         shared_strategy = _get_shared_strategy()
         old_strategy = shared_strategy.get('active_strategy')
         if old_strategy:
-            _strategy_debug_log(f"Clearing strategy cache (was: {old_strategy})")
+            _strategy_debug_log("Clearing strategy cache (was: %s)", old_strategy)
         shared_strategy['active_strategy'] = None
         shared_strategy['last_check_time'] = 0
         shared_strategy['pending_strategy'] = None
+        _publish_strategy_snapshot(shared_strategy)
 
 
 def _set_pending_strategy(strategy):
@@ -215,8 +344,22 @@ def _set_pending_strategy(strategy):
 
         if normalized_strategy != current_active:
             shared_strategy['pending_strategy'] = normalized_strategy
+            _publish_strategy_snapshot(shared_strategy)
             query_count = len(shared_strategy.get('query_strategy_map', {}))
-            _strategy_debug_log(f"Setting pending strategy: {normalized_strategy} (current: {current_active}, active queries: {query_count})")
+            _strategy_debug_log("Setting pending strategy: %s (current: %s, active queries: %s)",
+                                normalized_strategy, current_active, query_count)
+
+
+def _maybe_update_strategy(response):
+    """
+    Record the ``new_strategy`` advertised by an RPC response as pending.
+
+    The lock-free snapshot check skips the common case where the server echoes the active
+    strategy; ``_set_pending_strategy`` re-validates under the lock.
+    """
+    new_strategy = getattr(response, 'new_strategy', None)
+    if new_strategy and new_strategy.lower() != _strategy_snapshot.active:
+        _set_pending_strategy(new_strategy)
 
 
 def _apply_pending_strategy():
@@ -228,15 +371,16 @@ def _apply_pending_strategy():
             new_strategy = shared_strategy['pending_strategy']
             current_time = time.time()
 
-            _strategy_debug_log(f"Applying pending strategy: {old_strategy} -> {new_strategy}")
+            _strategy_debug_log("Applying pending strategy: %s -> %s", old_strategy, new_strategy)
             
             shared_strategy['active_strategy'] = new_strategy
             shared_strategy['pending_strategy'] = None
             shared_strategy['last_check_time'] = current_time
             shared_strategy['last_transition_time'] = current_time
             shared_strategy['session_invalidated'] = True  # Invalidate all sessions
-            
-            _strategy_debug_log(f"Strategy transition complete. All sessions invalidated.")
+            _publish_strategy_snapshot(shared_strategy)
+
+            _strategy_debug_log("Strategy transition complete. All sessions invalidated.")
 
             return new_strategy
         return None
@@ -245,8 +389,10 @@ def _apply_pending_strategy():
 def _invalidate_all_sessions():
     """Invalidate all existing sessions to force fresh connections with new strategy."""
     # This is a global flag that all connections will check
-    shared_strategy = _get_shared_strategy()
-    shared_strategy['session_invalidated'] = True
+    with _strategy_lock:
+        shared_strategy = _get_shared_strategy()
+        shared_strategy['session_invalidated'] = True
+        _publish_strategy_snapshot(shared_strategy)
 
 
 def _register_query_strategy(query_id, strategy):
@@ -258,52 +404,40 @@ def _register_query_strategy(query_id, strategy):
     if normalized_strategy not in ['blue', 'green']:
         return
 
-    with _strategy_lock:
-        shared_strategy = _get_shared_strategy()
-        query_map = shared_strategy.get('query_strategy_map', {})
-        query_map[query_id] = normalized_strategy
-        shared_strategy['query_strategy_map'] = query_map
-        _strategy_debug_log(f"Query {query_id} registered with strategy: {normalized_strategy}")
+    _query_strategy_map[query_id] = normalized_strategy
+    _strategy_debug_log("Query %s registered with strategy: %s", query_id, normalized_strategy)
 
 
 def _get_query_strategy(query_id):
     """Get the strategy used for a specific query."""
-    current_active_strategy = _get_active_strategy()
+    current_active_strategy = _strategy_snapshot.active
     if not query_id:
         return current_active_strategy
-    with _strategy_lock:
-        shared_strategy = _get_shared_strategy()
-        query_map = shared_strategy.get('query_strategy_map', {})
-        return query_map.get(query_id, current_active_strategy)
+    return _query_strategy_map.get(query_id, current_active_strategy)
 
 
 def _cleanup_query_strategy(query_id):
     """Remove the strategy mapping for a completed query."""
     if not query_id:
         return
-    with _strategy_lock:
-        shared_strategy = _get_shared_strategy()
-        query_map = shared_strategy.get('query_strategy_map', {})
-        if query_id in query_map:
-            strategy = query_map[query_id]
-            del query_map[query_id]
-            shared_strategy['query_strategy_map'] = query_map
-            remaining_queries = len(query_map)
-            _strategy_debug_log(f"Query {query_id} completed (was using {strategy}). Remaining active queries: {remaining_queries}")
+    strategy = _query_strategy_map.pop(query_id, None)
+    if strategy is not None:
+        remaining_queries = len(_query_strategy_map)
+        _strategy_debug_log("Query %s completed (was using %s). Remaining active queries: %s",
+                            query_id, strategy, remaining_queries)
 
 
 def _get_strategy_debug_info():
     """Get debug information about current strategy state."""
-    with _strategy_lock:
-        shared_strategy = _get_shared_strategy()
-        return {
-            'active_strategy': shared_strategy.get('active_strategy'),
-            'pending_strategy': shared_strategy.get('pending_strategy'),
-            'last_check_time': shared_strategy.get('last_check_time', 0),
-            'last_transition_time': shared_strategy.get('last_transition_time', 0),
-            'query_count': len(shared_strategy.get('query_strategy_map', {})),
-            'current_time': time.time()
-        }
+    snapshot = _strategy_snapshot
+    return {
+        'active_strategy': snapshot.active,
+        'pending_strategy': snapshot.pending,
+        'last_check_time': snapshot.last_check,
+        'last_transition_time': snapshot.last_transition,
+        'query_count': len(_query_strategy_map),
+        'current_time': time.time()
+    }
 
 
 def connect(*args, **kwargs):
@@ -317,6 +451,18 @@ def connect(*args, **kwargs):
 class Connection(object):
     """Create connection to e6data """
 
+    # Connections are long-lived and often pooled in large numbers, so keep their attributes in fixed
+    # slots rather than a per-instance dict.
+    __slots__ = (
+        '__username', '__password', '__weakref__',
+        '_auto_resume', '_channel', '_client', '_debug', '_grpc_options', '_grpc_options_tuple',
+        '_grpc_target', '_host', '_pool_channels', '_pool_clients', '_pool_counter', '_port',
+        '_require_fastbinary', '_secure_channel', '_session_id', '_shared_channel_keys', '_ssl_cert',
+        '_ssl_credentials', 'catalog_name', 'channel_pool_size', 'cluster_name', 'database',
+        'grpc_auto_resume_timeout_seconds', 'grpc_prepare_timeout', 'prefetch_batches', 'share_channels',
+        'uds_path',
+    )
+
     def __init__(
             self,
             host: str,
@@ -338,9 +484,10 @@ class Connection(object):
         Parameters
         ----------
             host: str
-                IP address or hostname of e6data cluster
+                IP address or hostname of e6data cluster. Use ``unix:<socket path>`` to reach an
+                engine on the same host over a Unix domain socket.
             port: int
-                Port of the e6data engine
+                Port of the e6data engine (ignored when connecting over a Unix domain socket)
             username: str
                 Your e6data Email ID
             password: str
@@ -367,6 +514,16 @@ class Connection(object):
                 - max_send_message_length: Similar to max_receive_message_length, this parameter sets the maximum allowed size (in bytes) for outgoing messages from the gRPC client
                 - grpc_prepare_timeout: Timeout for prepare statement API call (default to 10 minutes).
                 - keepalive_time_ms: This parameter defines the time, in milliseconds, Default to 30 seconds
+                - prefetch_batches: Number of result batches to request ahead of the consumer while rows are
+                  being processed (default 1). Set to 0 to disable prefetching.
+                - channel_pool_size: Number of gRPC channels (HTTP/2 connections) opened to the engine
+                  (default 1). Cursor RPCs (statements, status, metadata and result batch fetches)
+                  are spread across them round-robin.
+                - uds_path: Path of the engine's Unix domain socket when it runs on the same host. The
+                  channel then skips TCP and TLS entirely; ``secure`` and ``ssl_cert`` are not used.
+                - share_channels: Reuse the gRPC channels of other connections to the same engine with
+                  the same settings instead of opening new ones (default False). A shared channel is
+                  closed when the last connection using it is closed.
             debug: bool, Optional
                 Flag to enable debug logging for blue-green deployment strategy changes
             require_fastbinary: bool, Optional
@@ -388,6 +545,8 @@ class Connection(object):
 
         self._secure_channel = secure
         self._ssl_cert = ssl_cert
+        # Channel credentials are immutable, so the certificate is read once and reused on reconnects
+        self._ssl_credentials = None
 
         self.catalog_name = catalog
 
@@ -415,10 +574,16 @@ class Connection(object):
                     "Performance may be degraded. To enable fastbinary, install system dependencies: "
                     "https://github.com/e6x-labs/e6data-python-connector#dependencies"
                 )
+        # Every request and response goes through protobuf, whose pure Python backend is many
+        # times slower than the default upb/C++ one
+        if api_implementation.Type() == 'python':
+            logger.warning(
+                "protobuf is using its pure Python implementation. Performance may be degraded. "
+                "Unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION or upgrade protobuf to use the native backend."
+            )
 
-        self._grpc_options = grpc_options
-        if self._grpc_options is None:
-            self._grpc_options = dict()
+        # Copy so connector-specific keys popped below don't leak back into the caller's dict
+        self._grpc_options = dict(grpc_options) if grpc_options else dict()
         self.grpc_prepare_timeout = self._grpc_options.get('grpc_prepare_timeout') or 10 * 60  # 10 minutes
         self.grpc_auto_resume_timeout_seconds = 60 * 5  # 5 minutes
         if 'grpc_auto_resume_timeout_seconds' in self._grpc_options:
@@ -426,11 +591,48 @@ class Connection(object):
             The default maximum time on client side to wait for the cluster to resume is 5 minutes.
             """
             self.grpc_auto_resume_timeout_seconds = self._grpc_options.pop('grpc_auto_resume_timeout_seconds')
-        
+        # Options may arrive as strings (e.g. from a SQLAlchemy URL query), so coerce here rather than
+        # failing with a TypeError at the first fetch
+        self.prefetch_batches = int(self._grpc_options.pop('prefetch_batches', DEFAULT_PREFETCH_BATCHES))
+        if self.prefetch_batches < 0:
+            raise ValueError("prefetch_batches cannot be negative.")
+        self.channel_pool_size = max(1, self._grpc_options.pop('channel_pool_size', 1))
+        self.uds_path = self._grpc_options.pop('uds_path', None)
+        self.share_channels = bool(self._grpc_options.pop('share_channels', False))
+        self._shared_channel_keys = []
+        if not self.uds_path and self._host.startswith('unix:'):
+            self.uds_path = self._host[len('unix:'):]
+        # Channel target, formatted once for every channel (re)creation
+        if self.uds_path:
+            self._grpc_target = 'unix:{}'.format(self.uds_path)
+        else:
+            self._grpc_target = '{}:{}'.format(self._host, self._port)
+
+        # Channel options are fixed for the connection's lifetime, so merge them once here rather than
+        # on every channel (re)creation. User-supplied options override the defaults.
+        default_options = {
+            "keepalive_timeout_ms": 900000,  # Time in milliseconds to keep the connection alive.
+            "max_receive_message_length": -1,  # Maximum size of received messages.
+            "max_send_message_length": 300 * 1024 * 1024,  # Maximum size of sent messages (300 MB).
+            "grpc_prepare_timeout": self.grpc_prepare_timeout,  # Timeout for prepare statement API call.
+            "keepalive_time_ms": 30000,  # Time in milliseconds between keep-alive pings.
+            "keepalive_permit_without_calls": 1,  # Allow keep-alives with no active RPCs.
+            "http2.max_pings_without_data": 0,  # Unlimited pings without data.
+            "http2.min_time_between_pings_ms": 15000,  # Minimum time between pings (15 seconds).
+            "http2.min_ping_interval_without_data_ms": 15000,
+            # Minimum interval between pings without data (15 seconds).
+        }
+        if self.channel_pool_size > 1:
+            # Give every pooled channel its own subchannels (and TCP connection) instead of the
+            # process-wide subchannel pool, so the pool really spreads load across connections.
+            default_options["use_local_subchannel_pool"] = 1
+        default_options.update(self._grpc_options)
+        self._grpc_options_tuple = tuple((f'grpc.{key}', value) for key, value in default_options.items())
+
         # Store debug flag and register with debug connections
         self._debug = debug
         if self._debug:
-            _debug_connections.add(id(self))
+            _set_debug_connection(id(self), True)
 
         # Enable comprehensive debugging if debug flag is set
         if self._debug:
@@ -473,8 +675,8 @@ class Connection(object):
             e6data_logger = logging.getLogger('e6data_python_connector')
             e6data_logger.setLevel(logging.DEBUG)
 
-            _strategy_debug_log(f"Debug mode enabled for connection {id(self)}")
-            _strategy_debug_log(f"GRPC_TRACE={os.environ.get('GRPC_TRACE')}")
+            _strategy_debug_log("Debug mode enabled for connection %s", id(self))
+            _strategy_debug_log("GRPC_TRACE=%s", os.environ.get('GRPC_TRACE'))
 
         self._create_client()
 
@@ -483,64 +685,119 @@ class Connection(object):
         """
         Property to get gRPC options for the connection.
 
-        This method checks if the gRPC options are already cached. If not, it creates a copy of the
-        provided gRPC options and merges them with the default options. The merged options are then
-        cached for future use.
+        The defaults merged with the user-provided gRPC options are computed once in ``__init__``.
 
         Returns:
-            list: A list of tuples containing gRPC options.
-        """
-        if not hasattr(self, '_cached_grpc_options'):
-            grpc_options = self._grpc_options.copy()
-            default_options = {
-                "keepalive_timeout_ms": 900000,  # Time in milliseconds to keep the connection alive.
-                "max_receive_message_length": -1,  # Maximum size of received messages.
-                "max_send_message_length": 300 * 1024 * 1024,  # Maximum size of sent messages (300 MB).
-                "grpc_prepare_timeout": self.grpc_prepare_timeout,  # Timeout for prepare statement API call.
-                "keepalive_time_ms": 30000,  # Time in milliseconds between keep-alive pings.
-                "keepalive_permit_without_calls": 1,  # Allow keep-alives with no active RPCs.
-                "http2.max_pings_without_data": 0,  # Unlimited pings without data.
-                "http2.min_time_between_pings_ms": 15000,  # Minimum time between pings (15 seconds).
-                "http2.min_ping_interval_without_data_ms": 15000,
-                # Minimum interval between pings without data (15 seconds).
-            }
-            if grpc_options:
-                for key, value in grpc_options.items():
-                    default_options[key] = value
-
-            self._cached_grpc_options = [(f'grpc.{key}', value) for key, value in default_options.items()]
-
-        return self._cached_grpc_options
+            tuple: A tuple of ``(name, value)`` pairs containing gRPC options.
+        """
+        return self._grpc_options_tuple
+
+    def _open_channel(self, options):
+        """
+        Opens a gRPC channel to the engine.
+
+        If a Unix domain socket path is configured, it uses `grpc.insecure_channel` on that socket,
+        since a same-host engine needs neither TCP nor TLS. Otherwise, if the secure channel is
+        enabled, it uses `grpc.secure_channel` with SSL credentials, else `grpc.insecure_channel`.
+
+        Args:
+            options (tuple): gRPC channel options.
+
+        Returns:
+            grpc.Channel: The new channel.
+        """
+        if self._secure_channel and not self.uds_path:
+            if self._ssl_credentials is None:
+                self._ssl_credentials = get_ssl_credentials(self._ssl_cert)
+            return grpc.secure_channel(
+                target=self._grpc_target,
+                options=options,
+                credentials=self._ssl_credentials
+            )
+        return grpc.insecure_channel(
+            target=self._grpc_target,
+            options=options
+        )
+
+    def _new_channel(self, options):
+        """
+        Returns a gRPC channel for the given options.
+
+        With ``share_channels`` enabled, a channel already opened by another connection with the same
+        target, security settings and options is reused and its reference count incremented;
+        otherwise a new channel is opened.
+
+        Args:
+            options (tuple): gRPC channel options.
+
+        Returns:
+            grpc.Channel: The channel.
+        """
+        if not self.share_channels:
+            return self._open_channel(options)
+        key = (self._grpc_target, self._secure_channel and not self.uds_path, self._ssl_cert, options)
+        with _shared_channels_lock:
+            entry = _shared_channels.get(key)
+            if entry is None:
+                entry = _shared_channels[key] = [self._open_channel(options), 0]
+            entry[1] += 1
+        self._shared_channel_keys.append(key)
+        return entry[0]
 
     def _create_client(self):
         """
         Creates a gRPC client for the connection.
 
-        This method initializes a gRPC channel based on whether a secure channel is required or not.
-        It then creates a client stub for the QueryEngineService.
-
-        If the secure channel is enabled, it uses `grpc.secure_channel` with SSL credentials.
-        Otherwise, it uses `grpc.insecure_channel`.
+        This method initializes the primary gRPC channel (see `_new_channel`) and a client stub for
+        the QueryEngineService. When ``channel_pool_size`` is greater than 1, it also opens the
+        additional channels used by `acquire_client`. Each of those gets a distinct channel argument
+        so gRPC does not collapse them onto the primary channel's subchannel.
 
         The gRPC options are retrieved from the `_get_grpc_options` property.
 
         Raises:
             grpc.RpcError: If there is an error in creating the gRPC channel or client stub.
         """
-
-        if self._secure_channel:
-            self._channel = grpc.secure_channel(
-                target='{}:{}'.format(self._host, self._port),
-                options=self._get_grpc_options,
-                credentials=get_ssl_credentials(self._ssl_cert)
-            )
-        else:
-            self._channel = grpc.insecure_channel(
-                target='{}:{}'.format(self._host, self._port),
-                options=self._get_grpc_options
-            )
+        self._channel = self._new_channel(self._get_grpc_options)
         self._client = e6x_engine_pb2_grpc.QueryEngineServiceStub(self._channel)
 
+        self._pool_channels = [
+            self._new_channel(self._get_grpc_options + (('e6data.channel_index', index),))
+            for index in range(1, self.channel_pool_size)
+        ]
+        self._pool_clients = [self._client] + [
+            e6x_engine_pb2_grpc.QueryEngineServiceStub(channel) for channel in self._pool_channels
+        ]
+        self._pool_counter = itertools.count()
+
+    def _close_channels(self):
+        """
+        Closes the primary gRPC channel and any pooled channels.
+
+        Shared channels are only released; they are closed once no connection uses them anymore.
+        """
+        channels, self._pool_channels = [self._channel] + self._pool_channels, []
+        if self.share_channels:
+            keys, self._shared_channel_keys = self._shared_channel_keys, []
+            with _shared_channels_lock:
+                channels = []
+                for key in keys:
+                    entry = _shared_channels[key]
+                    entry[1] -= 1
+                    if entry[1] == 0:
+                        del _shared_channels[key]
+                        channels.append(entry[0])
+        # Close every channel even if one of them fails, then report the first failure
+        error = None
+        for channel in channels:
+            try:
+                channel.close()
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
     def get_re_authenticate_session_id(self):
         """
         Re-authenticates the session by closing the current connection and creating a new client.
@@ -565,23 +822,22 @@ class Connection(object):
         Also detects the active deployment strategy (blue/green) on first authentication.
         """
         # Check if we need a fresh connection due to strategy change
-        shared_strategy = _get_shared_strategy()
-        pending_strategy = shared_strategy.get('pending_strategy')
-        active_strategy = shared_strategy.get('active_strategy')
-        session_invalidated = shared_strategy.get('session_invalidated', False)
+        state = _strategy_snapshot
 
         # Check if session was invalidated globally
-        if self._session_id and session_invalidated:
+        if self._session_id and state.invalidated:
             self._session_id = None
             self.close()
             self._create_client()
             # Clear the invalidation flag
-            shared_strategy['session_invalidated'] = False
+            with _strategy_lock:
+                shared_strategy = _get_shared_strategy()
+                shared_strategy['session_invalidated'] = False
+                _publish_strategy_snapshot(shared_strategy)
 
         # Only create fresh connection if we have no active queries
-        elif self._session_id and pending_strategy and pending_strategy != active_strategy:
-            query_map = shared_strategy.get('query_strategy_map', {})
-            if len(query_map) == 0:
+        elif self._session_id and state.pending and state.pending != state.active:
+            if not _query_strategy_map:
                 # Apply the pending strategy immediately since no queries are active
                 _apply_pending_strategy()
                 # Force complete reconnection with new strategy
@@ -589,31 +845,34 @@ class Connection(object):
                 self.close()
                 self._create_client()
 
-        if not self._session_id:
+        # A strategy change reported by authenticate reconnects and authenticates again
+        for _attempt in range(MAX_RETRY_ATTEMPTS):
+            if self._session_id:
+                break
             try:
-                authenticate_request = e6x_engine_pb2.AuthenticateRequest(
+                authenticate_request = _AuthenticateRequest(
                     user=self.__username,
                     password=self.__password
                 )
 
                 # Check if we have a cached strategy
-                active_strategy = _get_active_strategy()
-                shared_strategy = _get_shared_strategy()
-                pending_strategy = shared_strategy.get('pending_strategy')
+                state = _strategy_snapshot
+                active_strategy = state.active
+                pending_strategy = state.pending
 
                 if active_strategy and not pending_strategy:
                     # Use cached strategy only if there's no pending strategy
-                    _strategy_debug_log(f"Authenticating with cached strategy: {active_strategy}")
+                    _strategy_debug_log("Authenticating with cached strategy: %s", active_strategy)
                     try:
                         authenticate_response = self._client.authenticate(
                             authenticate_request,
-                            metadata=_get_grpc_header(cluster=self.cluster_name, strategy=active_strategy)
+                            metadata=_get_grpc_header_tuple(cluster=self.cluster_name, strategy=active_strategy)
                         )
                         self._session_id = authenticate_response.sessionId
                         if not self._session_id:
                             raise ValueError("Invalid credentials.")
                         # Check for new strategy in authenticate response
-                        if hasattr(authenticate_response, 'new_strategy') and authenticate_response.new_strategy:
+                        if getattr(authenticate_response, 'new_strategy', None):
                             new_strategy = authenticate_response.new_strategy.lower()
                             if new_strategy != active_strategy:
                                 _set_pending_strategy(new_strategy)
@@ -621,17 +880,17 @@ class Connection(object):
                                 self._session_id = None
                                 self.close()
                                 self._create_client()
-                                return self.get_session_id
+                                continue
                     except _InactiveRpcError as e:
-                        if e.code() == grpc.StatusCode.UNKNOWN and 'status: 456' in e.details():
+                        if e.code() == _UNKNOWN and 'status: 456' in e.details():
                             # Strategy changed, clear cache and retry
-                            _strategy_debug_log(f"Got 456 error with strategy {active_strategy}, clearing cache and retrying")
+                            _strategy_debug_log("Got 456 error with strategy %s, clearing cache and retrying", active_strategy)
                             _clear_strategy_cache()
                             active_strategy = None
                         else:
                             if self._perform_auto_resume(e):
                                 # Cluster resumed, retry with cached strategy
-                                _strategy_debug_log(f"Cluster resumed, retrying with cached strategy {active_strategy}")
+                                _strategy_debug_log("Cluster resumed, retrying with cached strategy %s", active_strategy)
                                 active_strategy = None  # Force retry
                             else:
                                 raise e
@@ -645,27 +904,31 @@ class Connection(object):
                         # Use pending strategy and apply it immediately
                         _apply_pending_strategy()
                         active_strategy = _get_active_strategy()
-                        strategies = [active_strategy]
+                        strategies = collections.deque([active_strategy])
                     else:
                         # Always try blue first, then green if it fails with 456
-                        strategies = ['blue', 'green']
-                        _strategy_debug_log(f"No cached strategy, will try strategies in order: {strategies}")
+                        strategies = collections.deque(['blue', 'green'])
+                        _strategy_debug_log("No cached strategy, will try strategies in order: %s", list(strategies))
                     last_error = None
-                    for strategy in strategies:
-                        _strategy_debug_log(f"Attempting authentication with strategy: {strategy}.")
+                    strategy_changed = False
+                    resume_attempts = 0
+                    # Strategies still to try; a resumed cluster puts the current one back at the front
+                    while strategies:
+                        strategy = strategies.popleft()
+                        _strategy_debug_log("Attempting authentication with strategy: %s.", strategy)
                         try:
                             authenticate_response = self._client.authenticate(
                                 authenticate_request,
-                                metadata=_get_grpc_header(cluster=self.cluster_name, strategy=strategy)
+                                metadata=_get_grpc_header_tuple(cluster=self.cluster_name, strategy=strategy)
                             )
                             self._session_id = authenticate_response.sessionId
                             if self._session_id:
                                 # Success! Cache this strategy
-                                _strategy_debug_log(f"Authentication successful with strategy: {strategy}")
+                                _strategy_debug_log("Authentication successful with strategy: %s", strategy)
                                 _set_active_strategy(strategy)
 
                                 # Check for new strategy in authenticate response
-                                if hasattr(authenticate_response, 'new_strategy') and authenticate_response.new_strategy:
+                                if getattr(authenticate_response, 'new_strategy', None):
                                     new_strategy = authenticate_response.new_strategy.lower()
                                     if new_strategy != strategy:
                                         _set_pending_strategy(new_strategy)
@@ -673,23 +936,35 @@ class Connection(object):
                                         self.close()
                                         self._create_client()
                                         self._session_id = None
-                                        return self.get_session_id
+                                        strategy_changed = True
                                 break
                         except _InactiveRpcError as e:
-                            if e.code() == grpc.StatusCode.UNKNOWN and 'status: 456' in e.details():
+                            if e.code() == _UNKNOWN and 'status: 456' in e.details():
                                 # Wrong strategy, try the next one
-                                _strategy_debug_log(f"Strategy {strategy} failed with 456 error, trying next")
+                                _strategy_debug_log("Strategy %s failed with 456 error, trying next", strategy)
                                 last_error = e
                                 continue
+                            elif resume_attempts < MAX_RETRY_ATTEMPTS and self._perform_auto_resume(e):
+                                # Cluster resumed successfully, retry authentication with current strategy.
+                                # Retries are bounded and backed off so a flapping cluster cannot spin here.
+                                resume_attempts += 1
+                                _strategy_debug_log("Cluster resumed, retrying authentication with %s", strategy)
+                                time.sleep(min(RETRY_SLEEP_SECONDS * 2 ** (resume_attempts - 1), MAX_RETRY_SLEEP_SECONDS))
+                                strategies.appendleft(strategy)
+                                continue
+                            elif resume_attempts:
+                                # The cluster was resumed but authentication still fails; raised as a
+                                # non-RPC error so the outer handler does not attempt yet another resume
+                                raise OperationalError(
+                                    "Authentication failed after resuming the cluster {} times: {}".format(
+                                        resume_attempts, e.details())
+                                ) from e
                             else:
-                                if self._perform_auto_resume(e):
-                                    # Cluster resumed successfully, retry authentication with current strategy
-                                    _strategy_debug_log(f"Cluster resumed, retrying authentication with {strategy}")
-                                    continue
-                                else:
-                                    # Auto-resume failed, raise the error
-                                    raise e
+                                # Auto-resume failed, raise the error
+                                raise e
 
+                    if strategy_changed:
+                        continue
                     if not self._session_id and last_error:
                         # Neither strategy worked
                         raise last_error
@@ -699,13 +974,16 @@ class Connection(object):
             except _InactiveRpcError as e:
                 self._perform_auto_resume(e)
             except Exception as e:
-                self._channel.close()
+                self._close_channels()
                 raise e
+            break
+        else:
+            raise ValueError("Deployment strategy kept changing during authentication.")
         return self._session_id
 
     def _perform_auto_resume(self, e: _InactiveRpcError):
         if self._auto_resume:
-            if e.code() == grpc.StatusCode.UNAVAILABLE and 'status: 503' in e.details():
+            if e.code() == _UNAVAILABLE and 'status: 503' in e.details():
                 status = ClusterManager(
                     host=self._host,
                     port=self._port,
@@ -753,15 +1031,18 @@ class Connection(object):
 
         This method ensures that the gRPC channel is properly closed and the session ID is reset to None.
         """
-        if self._channel is not None:
-            self._channel.close()
+        try:
+            if self._channel is not None:
+                self._close_channels()
+        finally:
+            # Drop the references even when closing failed, so the channels are not kept alive
             self._channel = None
-        self._session_id = None
-        
-        # Remove from debug connections if debug was enabled
-        if self._debug:
-            _debug_connections.discard(id(self))
-            _strategy_debug_log(f"Debug mode disabled for connection {id(self)}")
+            self._session_id = None
+
+            # Remove from debug connections if debug was enabled
+            if self._debug:
+                _set_debug_connection(id(self), False)
+                _strategy_debug_log("Debug mode disabled for connection %s", id(self))
 
     def check_connection(self):
         """
@@ -779,12 +1060,8 @@ class Connection(object):
         Returns:
             bool: True if strategy was changed, False otherwise.
         """
-        shared_strategy = _get_shared_strategy()
-        pending_strategy = shared_strategy.get('pending_strategy')
-        active_strategy = shared_strategy.get('active_strategy')
-        query_map = shared_strategy.get('query_strategy_map', {})
-
-        if pending_strategy and pending_strategy != active_strategy and len(query_map) == 0:
+        state = _strategy_snapshot
+        if state.pending and state.pending != state.active and not _query_strategy_map:
             _apply_pending_strategy()
             # Force new authentication with new strategy
             self._session_id = None
@@ -798,16 +1075,13 @@ class Connection(object):
         Returns:
             bool: True if a new connection should be created.
         """
-        shared_strategy = _get_shared_strategy()
-        pending_strategy = shared_strategy.get('pending_strategy')
-        active_strategy = shared_strategy.get('active_strategy')
-        query_map = shared_strategy.get('query_strategy_map', {})
+        state = _strategy_snapshot
 
         # Create new connection if:
         # 1. No session exists
         # 2. There's a pending strategy change and no active queries
         return (not self._session_id or
-                (pending_strategy and pending_strategy != active_strategy and len(query_map) == 0))
+                (state.pending and state.pending != state.active and not _query_strategy_map))
 
     def clear(self, query_id, engine_ip=None):
         """
@@ -817,19 +1091,18 @@ class Connection(object):
             query_id (str): The ID of the query to be cleared.
             engine_ip (str, optional): The IP address of the engine. Defaults to None.
         """
-        clear_request = e6x_engine_pb2.ClearRequest(
+        clear_request = _ClearRequest(
             sessionId=self.get_session_id,
             queryId=query_id,
             engineIP=engine_ip
         )
         clear_response = self._client.clear(
             clear_request,
-            metadata=_get_grpc_header(engine_ip=engine_ip, cluster=self.cluster_name, strategy=_get_active_strategy())
+            metadata=_get_grpc_header_tuple(engine_ip=engine_ip, cluster=self.cluster_name, strategy=_get_active_strategy())
         )
 
         # Check for new strategy in clear response
-        if hasattr(clear_response, 'new_strategy') and clear_response.new_strategy:
-            _set_pending_strategy(clear_response.new_strategy)
+        _maybe_update_strategy(clear_response)
 
     def reopen(self):
         """
@@ -837,8 +1110,11 @@ class Connection(object):
 
         This method is useful for re-establishing the connection if it was previously closed.
         """
-        self._channel.close()
-        self._create_client()
+        try:
+            if self._channel is not None:
+                self._close_channels()
+        finally:
+            self._create_client()
 
     def query_cancel(self, engine_ip, query_id):
         """
@@ -848,19 +1124,18 @@ class Connection(object):
             engine_ip (str): The IP address of the engine.
             query_id (str): The ID of the query to be canceled.
         """
-        cancel_query_request = e6x_engine_pb2.CancelQueryRequest(
+        cancel_query_request = _CancelQueryRequest(
             engineIP=engine_ip,
             sessionId=self.get_session_id,
             queryId=query_id
         )
         cancel_response = self._client.cancelQuery(
             cancel_query_request,
-            metadata=_get_grpc_header(engine_ip=engine_ip, cluster=self.cluster_name, strategy=_get_active_strategy())
+            metadata=_get_grpc_header_tuple(engine_ip=engine_ip, cluster=self.cluster_name, strategy=_get_active_strategy())
         )
 
         # Check for new strategy in cancel response
-        if hasattr(cancel_response, 'new_strategy') and cancel_response.new_strategy:
-            _set_pending_strategy(cancel_response.new_strategy)
+        _maybe_update_strategy(cancel_response)
 
     def dry_run(self, query):
         """
@@ -872,14 +1147,14 @@ class Connection(object):
         Returns:
             str: The result of the dry run validation.
         """
-        dry_run_request = e6x_engine_pb2.DryRunRequest(
+        dry_run_request = _DryRunRequest(
             sessionId=self.get_session_id,
             schema=self.database,
             queryString=query
         )
         dry_run_response = self._client.dryRun(
             dry_run_request,
-            metadata=_get_grpc_header(cluster=self.cluster_name, strategy=_get_active_strategy())
+            metadata=_get_grpc_header_tuple(cluster=self.cluster_name, strategy=_get_active_strategy())
         )
         return dry_run_response.dryrunValue
 
@@ -894,19 +1169,18 @@ class Connection(object):
         Returns:
             list: A list of table names.
         """
-        get_table_request = e6x_engine_pb2.GetTablesV2Request(
+        get_table_request = _GetTablesV2Request(
             sessionId=self.get_session_id,
             schema=database,
             catalog=catalog
         )
         get_table_response = self._client.getTablesV2(
             get_table_request,
-            metadata=_get_grpc_header(cluster=self.cluster_name, strategy=_get_active_strategy())
+            metadata=_get_grpc_header_tuple(cluster=self.cluster_name, strategy=_get_active_strategy())
         )
 
         # Check for new strategy in get tables response
-        if hasattr(get_table_response, 'new_strategy') and get_table_response.new_strategy:
-            _set_pending_strategy(get_table_response.new_strategy)
+        _maybe_update_strategy(get_table_response)
         return list(get_table_response.tables)
 
     def get_columns(self, catalog, database, table):
@@ -921,7 +1195,7 @@ class Connection(object):
         Returns:
             list: A list of dictionaries containing column information.
         """
-        get_columns_request = e6x_engine_pb2.GetColumnsV2Request(
+        get_columns_request = _GetColumnsV2Request(
             sessionId=self.get_session_id,
             schema=database,
             table=table,
@@ -929,13 +1203,15 @@ class Connection(object):
         )
         get_columns_response = self._client.getColumnsV2(
             get_columns_request,
-            metadata=_get_grpc_header(cluster=self.cluster_name, strategy=_get_active_strategy())
+            metadata=_get_grpc_header_tuple(cluster=self.cluster_name, strategy=_get_active_strategy())
         )
 
         # Check for new strategy in get columns response
-        if hasattr(get_columns_response, 'new_strategy') and get_columns_response.new_strategy:
-            _set_pending_strategy(get_columns_response.new_strategy)
-        return [{'fieldName': row.fieldName, 'fieldType': row.fieldType} for row in get_columns_response.fieldInfo]
+        _maybe_update_strategy(get_columns_response)
+        return [
+            {'fieldName': name, 'fieldType': field_type}
+            for name, field_type in map(_column_field_info, get_columns_response.fieldInfo)
+        ]
 
     def get_schema_names(self, catalog):
         """
@@ -947,18 +1223,17 @@ class Connection(object):
         Returns:
             list: A list of schema names.
         """
-        get_schema_request = e6x_engine_pb2.GetSchemaNamesV2Request(
+        get_schema_request = _GetSchemaNamesV2Request(
             sessionId=self.get_session_id,
             catalog=catalog
         )
         get_schema_response = self._client.getSchemaNamesV2(
             get_schema_request,
-            metadata=_get_grpc_header(cluster=self.cluster_name, strategy=_get_active_strategy())
+            metadata=_get_grpc_header_tuple(cluster=self.cluster_name, strategy=_get_active_strategy())
         )
 
         # Check for new strategy in get schema names response
-        if hasattr(get_schema_response, 'new_strategy') and get_schema_response.new_strategy:
-            _set_pending_strategy(get_schema_response.new_strategy)
+        _maybe_update_strategy(get_schema_response)
 
         return list(get_schema_response.schemas)
 
@@ -998,11 +1273,26 @@ class Connection(object):
         """
         Returns the gRPC client stub for interacting with the server.
 
+        This is the primary channel's stub, used for connection-level calls such as authentication.
+        Cursor RPCs go through `acquire_client` so they spread across the channel pool.
+
         Returns:
             e6x_engine_pb2_grpc.QueryEngineServiceStub: The gRPC client stub.
         """
         return self._client
 
+    def acquire_client(self):
+        """
+        Returns the next gRPC client stub from the connection's channel pool, round-robin.
+
+        With the default ``channel_pool_size`` of 1 this is the same stub as `client`.
+
+        Returns:
+            e6x_engine_pb2_grpc.QueryEngineServiceStub: The gRPC client stub.
+        """
+        clients = self._pool_clients
+        return clients[next(self._pool_counter) % len(clients)]
+
 
 class Cursor(DBAPICursor):
     """
@@ -1023,15 +1313,25 @@ class Cursor(DBAPICursor):
             catalog_name (str, optional): The catalog name. Defaults to None.
         """
         super(Cursor, self).__init__()
-        self._array_size = array_size
+        self._arraysize = array_size
         self.connection = connection
         self._data = None
         self._query_columns_description = None
         self._is_metadata_updated = False
+        self._metadata_future = None
         self._description = None
         self._query_id = None
         self._engine_ip = None
+        self._session_id = None
+        self._grpc_header = None
+        self._grpc_header_key = None
+        self._next_batch_request = None
+        self._result_metadata_request = None
+        self._status_request = None
         self._batch = list()
+        self._prefetch_futures = collections.deque()
+        self._results_exhausted = False
+        self._explain_cache = dict()
         self._rowcount = 0
         self._database = self.connection.database if database is None else database
         self._catalog_name = catalog_name if catalog_name else self.connection.catalog_name
@@ -1046,11 +1346,43 @@ class Cursor(DBAPICursor):
         Get the gRPC metadata for the current query.
 
         Returns:
-            list: A list of tuples containing gRPC metadata.
+            tuple: A tuple of ``(key, value)`` pairs containing gRPC metadata.
         """
+        key = (self._query_id, self._engine_ip)
+        if self._grpc_header is not None and self._grpc_header_key == key:
+            return self._grpc_header
         # Use query-specific strategy if available, otherwise use active strategy
         strategy = _get_query_strategy(self._query_id) if self._query_id else _get_active_strategy()
-        return _get_grpc_header(engine_ip=self._engine_ip, cluster=self.connection.cluster_name, strategy=strategy)
+        header = _get_grpc_header_tuple(
+            engine_ip=self._engine_ip, cluster=self.connection.cluster_name, strategy=strategy
+        )
+        # A query keeps the strategy it was registered with, so its header is built once and reused
+        # by every batch RPC. Without a strategy the active one may still be resolved, so don't freeze it.
+        if self._query_id and strategy:
+            self._grpc_header = header
+            self._grpc_header_key = key
+        return header
+
+    def _invalidate_metadata(self):
+        """Drop the cached gRPC header so the next RPC rebuilds it (new query, session or strategy)."""
+        self._grpc_header = None
+        self._grpc_header_key = None
+
+    def _query_request(self, request_class):
+        """Build a ``request_class`` message addressed to the current query on its engine."""
+        return request_class(engineIP=self._engine_ip, sessionId=self._sid, queryId=self._query_id)
+
+    @property
+    def _sid(self):
+        """
+        Session ID used for the cursor's RPCs.
+
+        Resolved through ``connection.get_session_id`` once per query (``execute`` resets it) and
+        replaced on re-authentication, so fetch calls skip the connection's session checks.
+        """
+        if self._session_id is None:
+            self._session_id = self.connection.get_session_id
+        return self._session_id
 
     @property
     def arraysize(self):
@@ -1092,16 +1424,12 @@ class Cursor(DBAPICursor):
         The ``type_code`` can be interpreted by comparing it to the Type Objects specified in the
         section below.
         """
+        self._resolve_metadata()
         if self._description is None:
-            self._description = []
-            for col in self._query_columns_description:
-                type_code = col.get_field_type()
-                column_name = col.get_name()
-                self._description.append((
-                    column_name,
-                    type_code,
-                    None, None, None, None, True
-                ))
+            self._description = [
+                (col.name, col.field_type) + _DESCRIPTION_TAIL
+                for col in self._query_columns_description
+            ]
         return self._description
 
     def __enter__(self):
@@ -1132,6 +1460,7 @@ class Cursor(DBAPICursor):
             self.clear()
         except:
             pass
+        self._cancel_prefetch()
         self._arraysize = None
         self.connection = None
         self._data = None
@@ -1184,31 +1513,28 @@ class Cursor(DBAPICursor):
         """
         if not query_id:
             query_id = self._query_id
+        if query_id == self._query_id:
+            self._cancel_prefetch()
 
-        clear_request = e6x_engine_pb2.ClearOrCancelQueryRequest(
-            sessionId=self.connection.get_session_id,
+        clear_request = _ClearOrCancelQueryRequest(
+            sessionId=self._sid,
             queryId=query_id,
             engineIP=self._engine_ip
         )
         # Get fresh client after session access (may have been invalidated)
-        client = self.connection.client
+        client = self.connection.acquire_client()
         clear_response = client.clearOrCancelQuery(clear_request, metadata=self.metadata)
 
         # Check for new strategy in clear response
-        if hasattr(clear_response, 'new_strategy') and clear_response.new_strategy:
-            _set_pending_strategy(clear_response.new_strategy)
+        _maybe_update_strategy(clear_response)
 
         # Clean up query strategy mapping
         if query_id:
             _cleanup_query_strategy(query_id)
 
         # Check if this was the last query and we have a pending strategy
-        shared_strategy = _get_shared_strategy()
-        pending_strategy = shared_strategy.get('pending_strategy')
-        query_map = shared_strategy.get('query_strategy_map', {})
-
-        if pending_strategy and len(query_map) == 0:
-            _strategy_debug_log(f"Last query cleared, triggering pending strategy transition")
+        if _strategy_snapshot.pending and not _query_strategy_map:
+            _strategy_debug_log("Last query cleared, triggering pending strategy transition")
             _apply_pending_strategy()
 
         return clear_response
@@ -1227,12 +1553,8 @@ class Cursor(DBAPICursor):
             _cleanup_query_strategy(query_id)
 
         # Check if this was the last query and we have a pending strategy
-        shared_strategy = _get_shared_strategy()
-        pending_strategy = shared_strategy.get('pending_strategy')
-        query_map = shared_strategy.get('query_strategy_map', {})
-
-        if pending_strategy and len(query_map) == 0:
-            _strategy_debug_log(f"Last query cleared, triggering pending strategy transition")
+        if _strategy_snapshot.pending and not _query_strategy_map:
+            _strategy_debug_log("Last query cleared, triggering pending strategy transition")
             _apply_pending_strategy()
 
     def status(self, query_id):
@@ -1245,16 +1567,18 @@ class Cursor(DBAPICursor):
         Returns:
             StatusResponse: The status response of the query.
         """
-        status_request = e6x_engine_pb2.StatusRequest(
-            sessionId=self.connection.get_session_id,
-            queryId=query_id,
-            engineIP=self._engine_ip
-        )
-        status_response = self.connection.client.status(status_request, metadata=self.metadata)
+        # Status is typically polled until the query finishes, so the request is built once per query
+        status_request = self._status_request
+        if status_request is None or status_request.queryId != query_id:
+            status_request = self._status_request = _StatusRequest(
+                sessionId=self._sid,
+                queryId=query_id,
+                engineIP=self._engine_ip
+            )
+        status_response = self.connection.acquire_client().status(status_request, metadata=self.metadata)
 
         # Check for new strategy in status response
-        if hasattr(status_response, 'new_strategy') and status_response.new_strategy:
-            _set_pending_strategy(status_response.new_strategy)
+        _maybe_update_strategy(status_response)
 
         return status_response
 
@@ -1270,6 +1594,23 @@ class Cursor(DBAPICursor):
         Returns:
             str: The query ID of the executed query.
         """
+        # Batches prefetched for the previous query are no longer wanted
+        self._cancel_prefetch()
+        # Pick up any session change (re-authentication, strategy switch) before a new query
+        self._session_id = None
+        self._invalidate_metadata()
+        self._next_batch_request = None
+        self._result_metadata_request = None
+        self._status_request = None
+        # Metadata of the previous query is no longer valid
+        if self._metadata_future is not None:
+            self._metadata_future.cancel()
+            self._metadata_future = None
+        self._is_metadata_updated = False
+        self._description = None
+        self._results_exhausted = False
+        self._explain_cache = dict()
+
         # Semicolon is now not supported. So removing it from query end.
         operation = operation.strip()  # Remove leading and trailing whitespaces.
         if operation.endswith(';'):
@@ -1281,97 +1622,63 @@ class Cursor(DBAPICursor):
         else:
             sql = operation % _escaper.escape_args(parameters)
 
-        if not self._catalog_name:
-            prepare_statement_request = e6x_engine_pb2.PrepareStatementRequest(
-                sessionId=self.connection.get_session_id,
+        # V1 and V2 (catalog-qualified) statements differ only in request types, RPC names and the
+        # prepare timeout; the prepare/register/execute flow is shared.
+        if self._catalog_name:
+            prepare_statement_request = _PrepareStatementV2Request(
+                sessionId=self._sid,
                 schema=self._database,
+                catalog=self._catalog_name,
                 queryString=sql
             )
-            # Get fresh client after session access (may have been invalidated)
-            client = self.connection.client
-            prepare_statement_response = client.prepareStatement(
-                prepare_statement_request,
-                metadata=self.metadata
-            )
-
-            self._query_id = prepare_statement_response.queryId
-            self._engine_ip = prepare_statement_response.engineIP
-
-            # Check for new strategy in prepare response
-            if hasattr(prepare_statement_response, 'new_strategy') and prepare_statement_response.new_strategy:
-                new_strategy = prepare_statement_response.new_strategy.lower()
-                if new_strategy != _get_active_strategy():
-                    _set_pending_strategy(new_strategy)
-
-            # Register this query with the current strategy
-            current_strategy = _get_active_strategy()
-            if current_strategy:
-                _register_query_strategy(self._query_id, current_strategy)
-
-            execute_statement_request = e6x_engine_pb2.ExecuteStatementRequest(
-                engineIP=self._engine_ip,
-                sessionId=self.connection.get_session_id,
-                queryId=self._query_id,
-            )
-            # Get fresh client after session access (may have been invalidated)
-            client = self.connection.client
-            execute_response = client.executeStatement(
-                execute_statement_request,
-                metadata=self.metadata
-            )
-
-            # Check for new strategy in execute response
-            if hasattr(execute_response, 'new_strategy') and execute_response.new_strategy:
-                new_strategy = execute_response.new_strategy.lower()
-                if new_strategy != _get_active_strategy():
-                    _set_pending_strategy(new_strategy)
+            execute_request_class = _ExecuteStatementV2Request
+            prepare_rpc, execute_rpc = 'prepareStatementV2', 'executeStatementV2'
+            prepare_kwargs = {'timeout': self.connection.grpc_prepare_timeout}
         else:
-            prepare_statement_request = e6x_engine_pb2.PrepareStatementV2Request(
-                sessionId=self.connection.get_session_id,
+            prepare_statement_request = _PrepareStatementRequest(
+                sessionId=self._sid,
                 schema=self._database,
-                catalog=self._catalog_name,
                 queryString=sql
             )
-            # Get fresh client after session access (may have been invalidated)
-            client = self.connection.client
-            prepare_statement_response = client.prepareStatementV2(
-                prepare_statement_request,
-                metadata=self.metadata,
-                timeout=self.connection.grpc_prepare_timeout
-            )
+            execute_request_class = _ExecuteStatementRequest
+            prepare_rpc, execute_rpc = 'prepareStatement', 'executeStatement'
+            prepare_kwargs = {}
 
-            self._query_id = prepare_statement_response.queryId
-            self._engine_ip = prepare_statement_response.engineIP
+        # Get fresh client after session access (may have been invalidated)
+        client = self.connection.acquire_client()
+        prepare_statement_response = getattr(client, prepare_rpc)(
+            prepare_statement_request,
+            metadata=self.metadata,
+            **prepare_kwargs
+        )
 
-            # Check for new strategy in prepare response
-            if hasattr(prepare_statement_response, 'new_strategy') and prepare_statement_response.new_strategy:
-                new_strategy = prepare_statement_response.new_strategy.lower()
-                if new_strategy != _get_active_strategy():
-                    _set_pending_strategy(new_strategy)
+        self._query_id = prepare_statement_response.queryId
+        self._engine_ip = prepare_statement_response.engineIP
 
-            # Register this query with the current strategy
-            current_strategy = _get_active_strategy()
+        # Check for new strategy in prepare response
+        _maybe_update_strategy(prepare_statement_response)
 
-            if current_strategy:
-                _register_query_strategy(self._query_id, current_strategy)
+        # Register this query with the current strategy
+        current_strategy = _get_active_strategy()
+        if current_strategy:
+            _register_query_strategy(self._query_id, current_strategy)
 
-            execute_statement_request = e6x_engine_pb2.ExecuteStatementV2Request(
-                engineIP=self._engine_ip,
-                sessionId=self.connection.get_session_id,
-                queryId=self._query_id
-            )
-            # Get fresh client after session access (may have been invalidated)
-            client = self.connection.client
-            execute_response = client.executeStatementV2(
-                execute_statement_request,
-                metadata=self.metadata
-            )
+        execute_statement_request = execute_request_class(
+            engineIP=self._engine_ip,
+            sessionId=self._sid,
+            queryId=self._query_id
+        )
+        execute_response = getattr(client, execute_rpc)(
+            execute_statement_request,
+            metadata=self.metadata
+        )
 
-            # Check for new strategy in execute response
-            if hasattr(execute_response, 'new_strategy') and execute_response.new_strategy:
-                new_strategy = execute_response.new_strategy.lower()
-                if new_strategy != _get_active_strategy():
-                    _set_pending_strategy(new_strategy)
+        # Check for new strategy in execute response
+        _maybe_update_strategy(execute_response)
+        # Start the first result batch and the metadata call together. The metadata is read before
+        # returning, so its RPC errors reach re_auth like those of the statement calls above.
+        self._prefetch_next_batches()
+        self._metadata_future = self._request_result_metadata(future=True)
         self.update_mete_data()
         return self._query_id
 
@@ -1383,49 +1690,81 @@ class Cursor(DBAPICursor):
         Returns:
             int: The number of rows affected.
         """
-        self.update_mete_data()
+        # Metadata is read once per query; only go to the server when it has not been fetched yet
+        if not self._is_metadata_updated:
+            self.update_mete_data()
         return self._rowcount
 
+    def _request_result_metadata(self, future=False):
+        """
+        Issue a getResultMetadata call for the current query.
+
+        Args:
+            future (bool, optional): Return a ``grpc.Future`` instead of blocking for the response.
+
+        Returns:
+            GetResultMetadataResponse or grpc.Future: The response, or a future resolving to it.
+        """
+        result_meta_data_request = self._result_metadata_request
+        if result_meta_data_request is None:
+            result_meta_data_request = self._result_metadata_request = self._query_request(
+                _GetResultMetadataRequest
+            )
+        # Get fresh client after session access (may have been invalidated)
+        get_result_metadata = self.connection.acquire_client().getResultMetadata
+        if future:
+            return get_result_metadata.future(result_meta_data_request, metadata=self.metadata)
+        return get_result_metadata(result_meta_data_request, metadata=self.metadata)
+
+    def _resolve_metadata(self):
+        """
+        Read the result of a getResultMetadata call started by ``execute``, if still pending.
+        """
+        if self._metadata_future is not None:
+            self.update_mete_data()
+
     def update_mete_data(self):
         """
         Update the metadata for the current query.
+
+        Uses the getResultMetadata call started by ``execute`` when its result has not been read yet,
+        and returns without a round trip once the current query's metadata has been read.
         """
-        result_meta_data_request = e6x_engine_pb2.GetResultMetadataRequest(
-            engineIP=self._engine_ip,
-            sessionId=self.connection.get_session_id,
-            queryId=self._query_id
-        )
-        # Get fresh client after session access (may have been invalidated)
-        client = self.connection.client
-        get_result_metadata_response = client.getResultMetadata(
-            result_meta_data_request,
-            metadata=self.metadata
-        )
+        if self._is_metadata_updated and self._metadata_future is None:
+            return
+        if self._metadata_future is not None:
+            metadata_future, self._metadata_future = self._metadata_future, None
+            try:
+                get_result_metadata_response = metadata_future.result()
+            except grpc.RpcError:
+                # Re-issue a failed call blocking, so the error is raised as the _InactiveRpcError a
+                # direct call raises and callers' re-auth and strategy handling applies to it
+                get_result_metadata_response = self._request_result_metadata()
+        else:
+            get_result_metadata_response = self._request_result_metadata()
 
         # Check for new strategy in metadata response
-        if hasattr(get_result_metadata_response, 'new_strategy') and get_result_metadata_response.new_strategy:
-            new_strategy = get_result_metadata_response.new_strategy.lower()
-            if new_strategy != _get_active_strategy():
-                _set_pending_strategy(new_strategy)
+        _maybe_update_strategy(get_result_metadata_response)
 
-        buffer = BytesIO(get_result_metadata_response.resultMetaData)
-        self._rowcount, self._query_columns_description = get_query_columns_info(buffer)
+        self._rowcount, self._query_columns_description = get_query_columns_info(
+            get_result_metadata_response.resultMetaData
+        )
         self._is_metadata_updated = True
 
     def _fetch_more(self):
         """
-        Fetch more rows from the server.
+        Fetch batches from the server until at least ``arraysize`` rows are buffered.
 
         Returns:
-            list: A list of rows fetched from the server.
+            collections.deque: The buffered rows.
         """
-        batch_size = self._arraysize
-        self._data = list()
-        for i in range(batch_size):
+        if self._data is None:
+            self._data = collections.deque()
+        while len(self._data) < self._arraysize:
             rows = self.fetch_batch()
             if rows is None:
-                return
-            self._data = self._data + rows
+                break
+            self._data.extend(rows)
         return self._data
 
     def _fetch_all(self):
@@ -1435,13 +1774,14 @@ class Cursor(DBAPICursor):
         Returns:
             list: A list of all rows fetched from the server.
         """
-        self._data = list()
+        # Rows are appended straight into the result instead of keeping every batch list alive
+        # until a final concatenation, which doubled the peak size of the row references.
+        rows = list()
         while True:
-            rows = self.fetch_batch()
-            if rows is None:
+            columns = self._fetch_batch_columns()
+            if columns is None:
                 break
-            self._data = self._data + rows
-        rows = self._data
+            rows.extend(iter_rows_from_columns(columns))
         self._data = None
         return rows
 
@@ -1455,7 +1795,17 @@ class Cursor(DBAPICursor):
         Yields:
             list: A list of rows fetched from the server.
         """
-        if query_id:
+        if query_id and query_id != self._query_id:
+            self._cancel_prefetch()
+            self._next_batch_request = None
+            self._result_metadata_request = None
+            self._status_request = None
+            if self._metadata_future is not None:
+                self._metadata_future.cancel()
+                self._metadata_future = None
+            self._is_metadata_updated = False
+            self._results_exhausted = False
+            self._explain_cache = dict()
             self._query_id = query_id
         while True:
             rows = self.fetch_batch()
@@ -1463,42 +1813,268 @@ class Cursor(DBAPICursor):
                 return
             yield rows
 
-    def fetch_batch(self):
+    def fetchall_iter(self):
         """
-        Fetch a batch of rows from the server.
+        Iterate over all remaining rows of the current query, one row at a time.
+
+        Each server batch is decoded column-major and rows are produced from it lazily, so
+        neither the full result nor a batch's list of rows is materialized.
+
+        Yields:
+            list: A single row.
+        """
+        while True:
+            columns = self._fetch_batch_columns()
+            if columns is None:
+                return
+            yield from iter_rows_from_columns(columns)
+
+    def _request_next_result_batch(self, future=False):
+        """
+        Issue a getNextResultBatch call for the current query.
+
+        Args:
+            future (bool, optional): Return a ``grpc.Future`` instead of blocking for the response.
 
         Returns:
-            list: A list of rows fetched from the server.
+            GetNextResultBatchResponse or grpc.Future: The response, or a future resolving to it.
         """
-        get_next_result_batch_request = e6x_engine_pb2.GetNextResultBatchRequest(
-            engineIP=self._engine_ip,
-            sessionId=self.connection.get_session_id,
-            queryId=self._query_id
-        )
+        get_next_result_batch_request = self._next_batch_request
+        if get_next_result_batch_request is None:
+            # Identical for every batch of the query, so build it once
+            get_next_result_batch_request = self._next_batch_request = self._query_request(
+                _GetNextResultBatchRequest
+            )
         # Get fresh client after session access (may have been invalidated)
-        client = self.connection.client
-        get_next_result_batch_response = client.getNextResultBatch(
-            get_next_result_batch_request,
-            metadata=self.metadata
-        )
+        get_next_result_batch = self.connection.acquire_client().getNextResultBatch
+        if future:
+            return get_next_result_batch.future(get_next_result_batch_request, metadata=self.metadata)
+        return get_next_result_batch(get_next_result_batch_request, metadata=self.metadata)
+
+    def _prefetch_next_batches(self):
+        """
+        Keep up to ``connection.prefetch_batches`` getNextResultBatch calls in flight.
+
+        Batches must be requested in order, so another call is only issued once the previous
+        prefetch has completed with a non-empty batch.
+        """
+        futures = self._prefetch_futures
+        while len(futures) < self.connection.prefetch_batches:
+            if futures:
+                last = futures[-1]
+                if not last.done() or last.exception() is not None or not last.result().resultBatch:
+                    return
+            futures.append(self._request_next_result_batch(future=True))
+
+    def _cancel_prefetch(self):
+        """Cancel getNextResultBatch calls issued ahead of the consumer."""
+        while self._prefetch_futures:
+            self._prefetch_futures.popleft().cancel()
+
+    def _fetch_batch_columns(self):
+        """
+        Fetch a batch from the server and decode it column-major.
+
+        Returns:
+            list: One list of values per result column, or None when no more rows are available.
+        """
+        if self._prefetch_futures:
+            # A failed prefetch is raised, never re-issued: getNextResultBatch carries no batch index,
+            # so a retry after the server advanced would silently skip a batch
+            get_next_result_batch_response = self._prefetch_futures.popleft().result()
+        else:
+            get_next_result_batch_response = self._request_next_result_batch()
 
         # Check for new strategy in batch response
-        if hasattr(get_next_result_batch_response, 'new_strategy') and get_next_result_batch_response.new_strategy:
-            new_strategy = get_next_result_batch_response.new_strategy.lower()
-            if new_strategy != _get_active_strategy():
-                _set_pending_strategy(new_strategy)
+        _maybe_update_strategy(get_next_result_batch_response)
 
         buffer = get_next_result_batch_response.resultBatch
         if not self._is_metadata_updated:
             self.update_mete_data()
         if not buffer or len(buffer) == 0:
+            self._results_exhausted = True
             return None
+        # Request the following batch before decoding this one, so the round trip overlaps the decode
+        self._prefetch_next_batches()
         # one batch retrieves the predefined set of rows
-        return read_rows_from_chunk(
+        return read_columns_from_chunk(
             self._query_columns_description,
             buffer
         )
 
+    def fetch_batch(self):
+        """
+        Fetch a batch of rows from the server.
+
+        Returns:
+            list: A list of rows fetched from the server.
+        """
+        columns = self._fetch_batch_columns()
+        if columns is None:
+            return None
+        return rows_from_columns(columns)
+
+    def fetch_columnar(self, size: int = None):
+        """
+        Fetch rows from the server in column-major (struct-of-arrays) form.
+
+        Rows already buffered by a previous ``fetchmany``/``fetchone`` call are returned first.
+        Rows fetched beyond ``size`` stay buffered for the next fetch call.
+
+        Args:
+            size (int, optional): The maximum number of rows to fetch. Fetches all remaining
+                rows when None.
+
+        Returns:
+            tuple: One list of values per result column, in ``description`` order.
+        """
+        self._resolve_metadata()
+        columns = [list() for _ in self._query_columns_description]
+        fetched = 0
+        if self._data:
+            data = self._data
+            fetched = len(data) if size is None else min(size, len(data))
+            popleft = data.popleft
+            buffered = [popleft() for _ in range(fetched)]
+            for column, values in zip(columns, zip(*buffered)):
+                column.extend(values)
+            if not data:
+                self._data = None
+        while size is None or fetched < size:
+            batch = self._fetch_batch_columns()
+            if batch is None:
+                break
+            for column, values in zip(columns, batch):
+                column.extend(values)
+            if batch:
+                fetched += len(batch[0])
+        if size is not None and fetched > size:
+            self._data = collections.deque(rows_from_columns([column[size:] for column in columns]))
+            for column in columns:
+                del column[size:]
+        return tuple(columns)
+
+    def _arrow_arrays(self, pa, columns):
+        """
+        Build typed ``pyarrow`` arrays from column-major values.
+
+        Args:
+            pa (module): The imported ``pyarrow`` module.
+            columns (list): One list of values per result column, in ``description`` order.
+
+        Returns:
+            tuple: The list of arrays and the list of column names.
+        """
+        arrays = list()
+        names = list()
+        for col, values in zip(self._query_columns_description, columns):
+            names.append(col.get_name())
+            arrow_type = ARROW_TYPES.get(col.get_field_type())
+            try:
+                arrays.append(pa.array(values, type=getattr(pa, arrow_type)() if arrow_type else None))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Values that failed to decode are kept as-is; let Arrow infer a type for them
+                arrays.append(pa.array(values))
+        return arrays, names
+
+    def fetch_arrow(self, size: int = None):
+        """
+        Fetch rows from the server as a ``pyarrow.Table``.
+
+        Requires the optional ``pyarrow`` package. Columns are built straight from the
+        column-major batches, without materializing rows.
+
+        Args:
+            size (int, optional): The maximum number of rows to fetch. Fetches all remaining
+                rows when None.
+
+        Returns:
+            pyarrow.Table: The fetched rows, with one column per result column.
+
+        Raises:
+            NotSupportedError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise NotSupportedError("fetch_arrow requires pyarrow. Install it with `pip install pyarrow`.")
+
+        columns = self.fetch_columnar(size)
+        arrays, names = self._arrow_arrays(pa, columns)
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def fetch_arrow_batches(self):
+        """
+        Fetch the remaining rows as a stream of ``pyarrow.RecordBatch`` objects.
+
+        Requires the optional ``pyarrow`` package. Each server batch is converted as soon as it
+        arrives, so only one batch is held in memory at a time. Rows already buffered by a
+        previous ``fetchmany``/``fetchone`` call are yielded first.
+
+        Yields:
+            pyarrow.RecordBatch: One record batch per result batch.
+
+        Raises:
+            NotSupportedError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise NotSupportedError("fetch_arrow_batches requires pyarrow. Install it with `pip install pyarrow`.")
+
+        self._resolve_metadata()
+        if self._data:
+            arrays, names = self._arrow_arrays(pa, self.fetch_columnar(len(self._data)))
+            yield pa.RecordBatch.from_arrays(arrays, names=names)
+        while True:
+            columns = self._fetch_batch_columns()
+            if columns is None:
+                return
+            arrays, names = self._arrow_arrays(pa, columns)
+            yield pa.RecordBatch.from_arrays(arrays, names=names)
+
+    def fetch_numpy(self, size: int = None):
+        """
+        Fetch rows from the server as one ``numpy`` array per result column.
+
+        Requires the optional ``numpy`` package. Fixed-width numeric and boolean columns become
+        typed arrays; if such a column contains NULLs it is returned as a ``numpy.ma.MaskedArray``
+        with NULL positions masked. All other columns are returned as object arrays.
+
+        Args:
+            size (int, optional): The maximum number of rows to fetch. Fetches all remaining
+                rows when None.
+
+        Returns:
+            tuple: One array per result column, in ``description`` order.
+
+        Raises:
+            NotSupportedError: If numpy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise NotSupportedError("fetch_numpy requires numpy. Install it with `pip install numpy`.")
+
+        columns = self.fetch_columnar(size)
+        arrays = list()
+        for col, values in zip(self._query_columns_description, columns):
+            dtype = NUMPY_DTYPES.get(col.get_field_type())
+            if dtype is not None:
+                mask = [value is None for value in values]
+                try:
+                    if any(mask):
+                        filled = np.array([0 if value is None else value for value in values], dtype=dtype)
+                        arrays.append(np.ma.masked_array(filled, mask=mask))
+                    else:
+                        arrays.append(np.array(values, dtype=dtype))
+                    continue
+                except (TypeError, ValueError, OverflowError):
+                    # Values that failed to decode are kept as-is in an object array
+                    pass
+            arrays.append(np.fromiter(values, dtype=object, count=len(values)))
+        return tuple(arrays)
+
     def fetchall(self):
         """
          Fetch all rows from the server.
@@ -1521,79 +2097,130 @@ class Cursor(DBAPICursor):
         if size is None:
             size = self.arraysize
         if self._data is None:
-            self._data = list()
-        while len(self._data) < size:
+            self._data = collections.deque()
+        data = self._data
+        while len(data) < size:
             rows = self.fetch_batch()
             if rows is None:
                 break
-            self._data += rows
-        if len(self._data) <= size:
-            rows = self._data
+            data.extend(rows)
+        if len(data) <= size:
             self._data = None
-            return rows
-        rows = self._data[:size]
-        self._data = self._data[size:]
-        return rows
+            return list(data)
+        # Take rows off the front of the buffer instead of re-slicing the remainder on every call
+        popleft = data.popleft
+        return [popleft() for _ in range(size)]
 
     def fetchone(self):
         """
         Fetch a single row from the server.
 
+        Rows are taken off the front of the cursor's buffer; the server is only asked for the
+        next batch once the buffer is empty.
+
         Returns:
-            list: A single row fetched from the server.
+            list: The next row, or None when no more rows are available.
         """
-        rows = self.fetchmany(1)
-        if rows is None or len(rows) == 0:
-            return None
-        return rows
+        if self._data is None:
+            self._data = collections.deque()
+        data = self._data
+        while not data:
+            rows = self.fetch_batch()
+            if rows is None:
+                return None
+            data.extend(rows)
+        return data.popleft()
+
+    @staticmethod
+    async def _run_blocking(func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def execute_async(self, operation, parameters=None, **kwargs):
+        """
+        Coroutine variant of :py:meth:`execute` for asyncio applications.
+
+        The blocking gRPC calls run on the event loop's default executor, so many cursors
+        can execute and fetch concurrently without stalling the loop.
+
+        Returns:
+            str: The query ID.
+        """
+        return await self._run_blocking(self.execute, operation, parameters, **kwargs)
+
+    async def fetchmany_async(self, size: int = None):
+        """
+        Coroutine variant of :py:meth:`fetchmany`.
+
+        Returns:
+            list: A list of rows fetched from the server.
+        """
+        return await self._run_blocking(self.fetchmany, size)
+
+    async def fetchall_async(self):
+        """
+        Coroutine variant of :py:meth:`fetchall`.
+
+        Returns:
+            list: A list of all rows fetched from the server.
+        """
+        return await self._run_blocking(self.fetchall)
 
     def explain(self):
         """
         Get the execution plan for the current query.
 
+        The plan of a query does not change, so it is fetched once per query and cached.
+
         Returns:
             str: The execution plan of the query.
         """
-        explain_request = e6x_engine_pb2.ExplainRequest(
-            engineIP=self._engine_ip,
-            sessionId=self.connection.get_session_id,
-            queryId=self._query_id
-        )
-        explain_response = self.connection.client.explain(
-            explain_request,
+        if 'explain' in self._explain_cache:
+            return self._explain_cache['explain']
+        explain_response = self.connection.acquire_client().explain(
+            self._query_request(_ExplainRequest),
             metadata=self.metadata
         )
+        self._explain_cache['explain'] = explain_response.explain
         return explain_response.explain
 
     def explain_analyse(self):
         """
         Get the execution plan for the current query.
 
+        Runtime statistics keep changing while the query is still producing results, so the
+        response is only cached once every result batch has been fetched.
+
         Returns:
             dict: The execution plan of the query.
         """
-        explain_analyze_request = e6x_engine_pb2.ExplainAnalyzeRequest(
-            engineIP=self._engine_ip,
-            sessionId=self.connection.get_session_id,
-            queryId=self._query_id
-        )
+        if 'explain_analyse' in self._explain_cache:
+            return dict(self._explain_cache['explain_analyse'])
+        # Often polled while the query runs; the request is the same for every call on this query
+        explain_analyze_request = self._explain_cache.get('explain_analyse_request')
+        if explain_analyze_request is None:
+            explain_analyze_request = self._explain_cache['explain_analyse_request'] = self._query_request(
+                _ExplainAnalyzeRequest
+            )
         # Get fresh client after session access (may have been invalidated)
-        client = self.connection.client
+        client = self.connection.acquire_client()
         explain_analyze_response = client.explainAnalyze(
             explain_analyze_request,
             metadata=self.metadata
         )
 
         # Check for new strategy in explain analyze response
-        if hasattr(explain_analyze_response, 'new_strategy') and explain_analyze_response.new_strategy:
-            _set_pending_strategy(explain_analyze_response.new_strategy)
+        _maybe_update_strategy(explain_analyze_response)
 
-        return dict(
+        explain_analyse = dict(
             is_cached=explain_analyze_response.isCached,
             parsing_time=explain_analyze_response.parsingTime,
             queuing_time=explain_analyze_response.queueingTime,
             planner=explain_analyze_response.explainAnalyze,
         )
+        if self._results_exhausted:
+            self._explain_cache['explain_analyse'] = dict(explain_analyse)
+        return explain_analyse
 
 
 def poll(self, get_progress_update=True):
@@ -1617,14 +2244,24 @@ def fetch_logs(self):
     pass
 
 
-class Error(Exception):
-    pass
-
-
 #
 # Type Objects and Constructors
 #
 
-for type_id in PRIMITIVE_TYPES:
-    name = TypeId._VALUES_TO_NAMES[type_id]
-    setattr(sys.modules[__name__], name, DBAPITypeObject([name]))
+# One type object per primitive type name, resolved on attribute access (PEP 562) instead of
+# being set on the module one by one at import time
+_TYPE_OBJECTS = {
+    name: DBAPITypeObject([name])
+    for name in (TypeId._VALUES_TO_NAMES[type_id] for type_id in PRIMITIVE_TYPES)
+}
+
+
+def __getattr__(name):
+    try:
+        return _TYPE_OBJECTS[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TYPE_OBJECTS))
@@ -1,15 +1,27 @@
-class NotSupportedError(Exception):
+class Error(Exception):
+    """Base class of every error raised by e6xdb (PEP 249)"""
+    pass
+
+class InterfaceError(Error):
+    """Raised when the database interface itself is misused"""
+    pass
+
+class DatabaseError(Error):
+    """Raised for errors related to the database"""
+    pass
+
+class NotSupportedError(DatabaseError):
     """Raised when op not supported by e6xdb"""
     pass
 
-class ProgrammingError(Exception):
+class ProgrammingError(DatabaseError):
     """Raised when op not supported by e6xdb"""
     pass
 
-class DataError(Exception):
+class DataError(DatabaseError):
     """Raised when there are inherent data issues"""
     pass
 
-class OperationalError(Exception):
+class OperationalError(DatabaseError):
     """Raised when there are operational issues in Uniphi"""
-    pass
\ No newline at end of file
+    pass
@@ -6,8 +6,8 @@ imported by both the main e6data_grpc module and the cluster_manager module
 without causing circular imports.
 """
 
+import functools
 import logging
-import multiprocessing
 import time
 import threading
 
@@ -65,12 +65,12 @@ def _set_active_strategy(strategy):
     # Validate strategy
     normalized_strategy = strategy.lower()
     if normalized_strategy not in ['blue', 'green']:
-        _logger.warning(f"Invalid strategy value: {strategy}. Must be 'blue' or 'green'.")
+        _logger.warning("Invalid strategy value: %s. Must be 'blue' or 'green'.", strategy)
         return
     
     shared_strategy['active_strategy'] = normalized_strategy
     shared_strategy['last_check_time'] = time.time()
-    _logger.info(f"Active deployment strategy set to: {normalized_strategy}")
+    _logger.info("Active deployment strategy set to: %s", normalized_strategy)
 
 
 def _set_pending_strategy(strategy):
@@ -83,13 +83,13 @@ def _set_pending_strategy(strategy):
     # Validate strategy
     normalized_strategy = strategy.lower()
     if normalized_strategy not in ['blue', 'green']:
-        _logger.warning(f"Invalid pending strategy value: {strategy}. Must be 'blue' or 'green'.")
+        _logger.warning("Invalid pending strategy value: %s. Must be 'blue' or 'green'.", strategy)
         return
     
     current_active = shared_strategy.get('active_strategy')
     if normalized_strategy != current_active:
         shared_strategy['pending_strategy'] = normalized_strategy
-        _logger.info(f"Pending deployment strategy set to: {normalized_strategy}")
+        _logger.info("Pending deployment strategy set to: %s", normalized_strategy)
 
 
 def _clear_strategy_cache():
@@ -142,12 +142,12 @@ def _apply_pending_strategy():
         query_map = shared_strategy.get('query_strategy_map', {})
         if len(query_map) == 0:
             # No active queries, safe to transition
-            _logger.info(f"Last query completed, applying pending strategy: {pending_strategy}")
+            _logger.info("Last query completed, applying pending strategy: %s", pending_strategy)
             shared_strategy['active_strategy'] = pending_strategy
             shared_strategy['pending_strategy'] = None
             shared_strategy['last_transition_time'] = time.time()
             shared_strategy['session_invalidated'] = True  # Invalidate all sessions
-            _logger.info(f"Strategy transition completed: {active_strategy} -> {pending_strategy}")
+            _logger.info("Strategy transition completed: %s -> %s", active_strategy, pending_strategy)
 
 
 def _is_strategy_cache_valid():
@@ -180,5 +180,19 @@ def _get_grpc_header(engine_ip=None, cluster=None, strategy=None):
         if normalized_strategy in ['blue', 'green']:
             metadata.append(('strategy', normalized_strategy))
         else:
-            _logger.warning(f"Invalid strategy value in header: {strategy}. Must be 'blue' or 'green'.")
-    return metadata
\ No newline at end of file
+            _logger.warning("Invalid strategy value in header: %s. Must be 'blue' or 'green'.", strategy)
+    return metadata
+
+
+@functools.lru_cache(maxsize=64)
+def _get_grpc_header_tuple(engine_ip=None, cluster=None, strategy=None):
+    """
+    Cached, immutable variant of :func:`_get_grpc_header` used when issuing RPCs.
+
+    The header depends only on its arguments, so each (engine_ip, cluster, strategy)
+    combination is built once and the same tuple is passed as metadata on later calls.
+
+    Returns:
+        tuple: A tuple of tuples representing the gRPC metadata headers.
+    """
+    return tuple(_get_grpc_header(engine_ip=engine_ip, cluster=cluster, strategy=strategy))
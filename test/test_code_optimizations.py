@@ -199,6 +199,169 @@ class TestGrpcHeaderFunction(unittest.TestCase):
         self.assertIn('cluster-name', header_keys)  # Actual header name
         self.assertIn('strategy', header_keys)
 
+    def test_get_grpc_header_tuple_is_cached(self):
+        """Test that the tuple variant builds each header once."""
+        from e6data_python_connector.strategy import _get_grpc_header_tuple
+        headers = _get_grpc_header_tuple(engine_ip='192.168.1.1', cluster='test-cluster', strategy='Blue')
+        self.assertEqual(headers, tuple(_get_grpc_header(engine_ip='192.168.1.1', cluster='test-cluster',
+                                                         strategy='Blue')))
+        self.assertIs(_get_grpc_header_tuple(engine_ip='192.168.1.1', cluster='test-cluster', strategy='Blue'),
+                      headers)
+
+
+class TestStrategySnapshot(unittest.TestCase):
+    """Test that strategy readers see every write through the published snapshot."""
+
+    def setUp(self):
+        from e6data_python_connector import e6data_grpc
+        self.grpc = e6data_grpc
+        e6data_grpc._clear_strategy_cache()
+        self.addCleanup(e6data_grpc._clear_strategy_cache)
+
+    def test_readers_follow_writes(self):
+        grpc_module = self.grpc
+        grpc_module._set_active_strategy('blue')
+        self.assertEqual(grpc_module._get_active_strategy(), 'blue')
+        grpc_module._register_query_strategy('q1', 'blue')
+        grpc_module._set_pending_strategy('green')
+        self.assertEqual(grpc_module._get_strategy_debug_info()['pending_strategy'], 'green')
+        self.assertEqual(grpc_module._get_strategy_debug_info()['query_count'], 1)
+
+        grpc_module._apply_pending_strategy()
+        self.assertEqual(grpc_module._get_active_strategy(), 'green')
+        self.assertEqual(grpc_module._get_query_strategy('q1'), 'blue')
+        grpc_module._cleanup_query_strategy('q1')
+        self.assertEqual(grpc_module._get_query_strategy('q1'), 'green')
+
+    def test_maybe_update_strategy(self):
+        grpc_module = self.grpc
+        grpc_module._set_active_strategy('blue')
+        grpc_module._maybe_update_strategy(Mock(new_strategy=''))
+        grpc_module._maybe_update_strategy(Mock(new_strategy='BLUE'))
+        grpc_module._maybe_update_strategy(object())
+        self.assertIsNone(grpc_module._get_strategy_debug_info()['pending_strategy'])
+        grpc_module._maybe_update_strategy(Mock(new_strategy='Green'))
+        self.assertEqual(grpc_module._get_strategy_debug_info()['pending_strategy'], 'green')
+
+
+class _ClusterSuspendedError(grpc._channel._InactiveRpcError):
+    """An authenticate failure that auto-resume treats as a suspended cluster."""
+
+    def __init__(self):
+        pass
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+    def details(self):
+        return 'status: 503'
+
+
+class TestAuthenticateStrategyChange(unittest.TestCase):
+    """Test re-authentication when authenticate reports a different strategy."""
+
+    def setUp(self):
+        from e6data_python_connector import e6data_grpc
+        self.grpc = e6data_grpc
+        e6data_grpc._clear_strategy_cache()
+        self.addCleanup(self._reset_strategy)
+
+    def _reset_strategy(self):
+        self.grpc._clear_strategy_cache()
+        with self.grpc._strategy_lock:
+            shared_strategy = self.grpc._get_shared_strategy()
+            shared_strategy['session_invalidated'] = False
+            self.grpc._publish_strategy_snapshot(shared_strategy)
+
+    @patch('e6data_python_connector.e6data_grpc.e6x_engine_pb2_grpc.QueryEngineServiceStub')
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_new_strategy_triggers_one_more_authentication(self, insecure_channel, stub_class):
+        from types import SimpleNamespace
+        responses = [SimpleNamespace(sessionId='first', new_strategy='green'),
+                     SimpleNamespace(sessionId='second', new_strategy='')]
+        authenticate = stub_class.return_value.authenticate
+        authenticate.side_effect = lambda request, metadata: responses.pop(0)
+
+        conn = self.grpc.Connection(host='localhost', port=80, username='user', password='token',
+                                    require_fastbinary=False)
+        self.assertEqual(conn.get_session_id, 'second')
+        self.assertEqual(self.grpc._get_active_strategy(), 'green')
+        self.assertEqual([dict(call.kwargs['metadata'])['strategy'] for call in authenticate.call_args_list],
+                         ['blue', 'green'])
+
+    @patch('e6data_python_connector.e6data_grpc.time.sleep')
+    @patch('e6data_python_connector.e6data_grpc.e6x_engine_pb2_grpc.QueryEngineServiceStub')
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_resumed_cluster_retries_same_strategy(self, insecure_channel, stub_class, sleep):
+        from types import SimpleNamespace
+        responses = [_ClusterSuspendedError(), SimpleNamespace(sessionId='session', new_strategy='')]
+
+        def authenticate(request, metadata):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        stub_class.return_value.authenticate.side_effect = authenticate
+        conn = self.grpc.Connection(host='localhost', port=80, username='user', password='token',
+                                    require_fastbinary=False)
+        with patch.object(self.grpc.Connection, '_perform_auto_resume', return_value=True):
+            self.assertEqual(conn.get_session_id, 'session')
+        self.assertEqual(self.grpc._get_active_strategy(), 'blue')
+        sleep.assert_called_once_with(constants.RETRY_SLEEP_SECONDS)
+
+    @patch('e6data_python_connector.e6data_grpc.time.sleep')
+    @patch('e6data_python_connector.e6data_grpc.e6x_engine_pb2_grpc.QueryEngineServiceStub')
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_resumed_cluster_retries_are_bounded(self, insecure_channel, stub_class, sleep):
+        authenticate = stub_class.return_value.authenticate
+        authenticate.side_effect = _ClusterSuspendedError()
+        conn = self.grpc.Connection(host='localhost', port=80, username='user', password='token',
+                                    require_fastbinary=False)
+        with patch.object(self.grpc.Connection, '_perform_auto_resume', return_value=True) as resume:
+            with self.assertRaises(self.grpc.OperationalError):
+                conn.get_session_id
+        self.assertEqual(resume.call_count, constants.MAX_RETRY_ATTEMPTS)
+        self.assertEqual([dict(call.kwargs['metadata'])['strategy'] for call in authenticate.call_args_list],
+                         ['blue'] * (constants.MAX_RETRY_ATTEMPTS + 1))
+        self.assertEqual(sleep.call_count, constants.MAX_RETRY_ATTEMPTS)
+
+
+class TestCatalogListings(unittest.TestCase):
+    """Test that table and schema listings are returned as plain lists."""
+
+    @patch('e6data_python_connector.e6data_grpc.e6x_engine_pb2_grpc.QueryEngineServiceStub')
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_listings_are_lists(self, insecure_channel, stub_class):
+        from types import SimpleNamespace
+        from e6data_python_connector import e6data_grpc
+        e6data_grpc._clear_strategy_cache()
+        self.addCleanup(e6data_grpc._clear_strategy_cache)
+        stub = stub_class.return_value
+        stub.authenticate.return_value = SimpleNamespace(sessionId='session', new_strategy='')
+        stub.getTablesV2.return_value = SimpleNamespace(tables=('orders', 'users'), new_strategy='')
+        stub.getSchemaNamesV2.return_value = SimpleNamespace(schemas=('sales',), new_strategy='')
+        conn = e6data_grpc.Connection(host='localhost', port=80, username='user', password='token',
+                                      require_fastbinary=False)
+        self.assertEqual(conn.get_tables('catalog', 'sales'), ['orders', 'users'])
+        self.assertEqual(conn.get_schema_names('catalog'), ['sales'])
+
+
+class TestDebugConnections(unittest.TestCase):
+    """Test the published snapshot of debug-enabled connections."""
+
+    def test_set_debug_connection_publishes_new_snapshot(self):
+        from e6data_python_connector import e6data_grpc
+        before = e6data_grpc._debug_connections
+        e6data_grpc._set_debug_connection(12345, True)
+        enabled = e6data_grpc._debug_connections
+        self.assertIn(12345, enabled)
+        self.assertNotIn(12345, before)
+        self.assertIsInstance(enabled, frozenset)
+        e6data_grpc._set_debug_connection(12345, False)
+        self.assertNotIn(12345, e6data_grpc._debug_connections)
+        self.assertIn(12345, enabled)
+
 
 class TestReAuthDecorator(unittest.TestCase):
     """Test cases for re_auth decorator with constants."""
@@ -240,6 +403,41 @@ class TestReAuthDecorator(unittest.TestCase):
         self.assertNotIn("'status: 456'", source,
                         "Should use GRPC_ERROR_STRATEGY_MISMATCH constant")
 
+    def test_reauth_retries_after_access_denied(self):
+        """Test that re_auth re-authenticates once and retries, preserving the wrapped function's metadata."""
+        from grpc._channel import _InactiveRpcError
+        from e6data_python_connector.e6data_grpc import re_auth
+
+        class RpcError(_InactiveRpcError):
+            def __init__(self, code, details):
+                self._code, self._details = code, details
+
+            def code(self):
+                return self._code
+
+            def details(self):
+                return self._details
+
+        errors = [RpcError(grpc.StatusCode.INTERNAL, constants.GRPC_ERROR_ACCESS_DENIED)]
+
+        class FakeCursor(object):
+            connection = Mock()
+            _invalidate_metadata = Mock()
+
+            @re_auth
+            def execute(self):
+                """Run the query."""
+                if errors:
+                    raise errors.pop()
+                return 'query'
+
+        cursor = FakeCursor()
+        with patch('e6data_python_connector.e6data_grpc.time.sleep'):
+            self.assertEqual(cursor.execute(), 'query')
+        cursor.connection.get_re_authenticate_session_id.assert_called_once()
+        self.assertEqual(FakeCursor.execute.__name__, 'execute')
+        self.assertEqual(FakeCursor.execute.__doc__, 'Run the query.')
+
 
 class TestCodeDuplicationRemoval(unittest.TestCase):
     """Test that code duplication has been properly removed."""
@@ -318,5 +516,218 @@ class TestConstantsIntegration(unittest.TestCase):
         self.assertEqual(constants.DEFAULT_AUTO_RESUME_TIMEOUT_SECONDS, 300)
 
 
+class TestUnixDomainSocketChannel(unittest.TestCase):
+    """Test that same-host engines are reached over a Unix domain socket."""
+
+    def _connect(self, host, **grpc_options):
+        from e6data_python_connector.e6data_grpc import Connection
+        return Connection(host=host, port=80, username='user', password='token',
+                          secure=True, grpc_options=grpc_options, require_fastbinary=False)
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.secure_channel')
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_uds_path_option_uses_insecure_unix_channel(self, insecure_channel, secure_channel):
+        options = {'uds_path': '/tmp/engine.sock'}
+        conn = self._connect('localhost', **options)
+        self.assertEqual(insecure_channel.call_args.kwargs['target'], 'unix:/tmp/engine.sock')
+        secure_channel.assert_not_called()
+        self.assertNotIn('grpc.uds_path', dict(conn._get_grpc_options))
+        self.assertEqual(options, {'uds_path': '/tmp/engine.sock'})
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_unix_host_uses_socket_path(self, insecure_channel):
+        self._connect('unix:/var/run/e6data.sock')
+        self.assertEqual(insecure_channel.call_args.kwargs['target'], 'unix:/var/run/e6data.sock')
+
+
+class TestSSLCredentialsCache(unittest.TestCase):
+    """Test that a connection reads its SSL credentials once."""
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.secure_channel')
+    @patch('e6data_python_connector.e6data_grpc.get_ssl_credentials')
+    def test_credentials_are_reused_on_reconnect(self, get_credentials, secure_channel):
+        from e6data_python_connector.e6data_grpc import Connection
+        conn = Connection(host='engine', port=443, username='user', password='token', secure=True,
+                          ssl_cert=b'pem', grpc_options={'channel_pool_size': 2}, require_fastbinary=False)
+        conn._close_channels()
+        conn._create_client()
+
+        get_credentials.assert_called_once_with(b'pem')
+        self.assertEqual(secure_channel.call_count, 4)
+        for call in secure_channel.call_args_list:
+            self.assertIs(call.kwargs['credentials'], get_credentials.return_value)
+
+
+class TestChannelPool(unittest.TestCase):
+    """Test the per-connection gRPC channel pool."""
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_pooled_channels_are_distinct_and_round_robin(self, insecure_channel):
+        from e6data_python_connector.e6data_grpc import Connection
+        insecure_channel.side_effect = lambda target, options: MagicMock()
+        conn = Connection(host='localhost', port=80, username='user', password='token',
+                          grpc_options={'channel_pool_size': 3}, require_fastbinary=False)
+
+        self.assertEqual(insecure_channel.call_count, 3)
+        indexes = [dict(call.kwargs['options']).get('e6data.channel_index') for call in insecure_channel.call_args_list]
+        self.assertEqual(indexes, [None, 1, 2])
+        self.assertTrue(all(dict(call.kwargs['options']).get('grpc.use_local_subchannel_pool') == 1
+                            for call in insecure_channel.call_args_list))
+        clients = [conn.acquire_client() for _ in range(4)]
+        self.assertIs(clients[0], conn.client)
+        self.assertEqual(len({id(client) for client in clients[:3]}), 3)
+        self.assertIs(clients[3], clients[0])
+
+        channels = [conn._channel] + conn._pool_channels
+        conn.close()
+        for channel in channels:
+            channel.close.assert_called_once()
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_close_releases_channels_when_one_close_fails(self, insecure_channel):
+        from e6data_python_connector.e6data_grpc import Connection
+        insecure_channel.side_effect = lambda target, options: MagicMock()
+        conn = Connection(host='localhost', port=80, username='user', password='token',
+                          grpc_options={'channel_pool_size': 3}, require_fastbinary=False)
+        channels = [conn._channel] + conn._pool_channels
+        channels[0].close.side_effect = RuntimeError('bad channel')
+
+        with self.assertRaises(RuntimeError):
+            conn.close()
+        for channel in channels:
+            channel.close.assert_called_once()
+        self.assertIsNone(conn._channel)
+        self.assertEqual(conn._pool_channels, [])
+
+    @patch('e6data_python_connector.e6data_grpc.api_implementation.Type', return_value='python')
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_warns_about_pure_python_protobuf(self, insecure_channel, backend):
+        from e6data_python_connector.e6data_grpc import Connection
+        with self.assertLogs('e6data_python_connector.e6data_grpc', level='WARNING') as logs:
+            Connection(host='localhost', port=80, username='user', password='token', require_fastbinary=False)
+        self.assertTrue(any('protobuf' in message for message in logs.output))
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_connection_uses_slots(self, insecure_channel):
+        from e6data_python_connector.e6data_grpc import Connection
+        conn = Connection(host='localhost', port=80, username='user', password='token', require_fastbinary=False)
+        self.assertFalse(hasattr(conn, '__dict__'))
+        with self.assertRaises(AttributeError):
+            conn.unknown_attribute = 1
+
+
+class TestPrefetchBatchesOption(unittest.TestCase):
+    """Test validation of the prefetch_batches connection option."""
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_option_is_coerced_and_validated(self, insecure_channel):
+        from e6data_python_connector.e6data_grpc import Connection
+        conn = Connection(host='localhost', port=80, username='user', password='token',
+                          grpc_options={'prefetch_batches': '2'}, require_fastbinary=False)
+        self.assertEqual(conn.prefetch_batches, 2)
+        for value in ('-1', 'many'):
+            with self.assertRaises(ValueError):
+                Connection(host='localhost', port=80, username='user', password='token',
+                           grpc_options={'prefetch_batches': value}, require_fastbinary=False)
+
+
+class TestHiveParamEscaper(unittest.TestCase):
+    """Test string escaping of query parameters."""
+
+    def test_escape_string(self):
+        from e6data_python_connector.e6data_grpc import _escaper
+        self.assertEqual(_escaper.escape_string('plain'), "'plain'")
+        self.assertEqual(_escaper.escape_string("it's"), "'it\\'s'")
+        self.assertEqual(_escaper.escape_string('a\\b\r\n\t'), "'a\\\\b\\r\\n\\t'")
+        self.assertEqual(_escaper.escape_string(b"caf\xc3\xa9 '"), "'caf\u00e9 \\''")
+
+
+class TestExceptions(unittest.TestCase):
+    """Test the DB-API exception hierarchy."""
+
+    def test_errors_share_pep_249_base_classes(self):
+        from e6data_python_connector import e6data_grpc
+        for name in ('NotSupportedError', 'ProgrammingError', 'DataError', 'OperationalError'):
+            self.assertTrue(issubclass(getattr(e6data_grpc, name), e6data_grpc.DatabaseError))
+        self.assertTrue(issubclass(e6data_grpc.DatabaseError, e6data_grpc.Error))
+        self.assertTrue(issubclass(e6data_grpc.InterfaceError, e6data_grpc.Error))
+
+
+class TestTypeObjects(unittest.TestCase):
+    """Test the module-level DB-API type objects."""
+
+    def test_type_objects_resolve_lazily(self):
+        from e6data_python_connector import e6data_grpc
+        from e6data_python_connector.e6data_grpc import STRING_TYPE
+        self.assertIs(STRING_TYPE, e6data_grpc.STRING_TYPE)
+        self.assertEqual(STRING_TYPE.values, (['STRING_TYPE'],))
+        self.assertIn('BIGINT_TYPE', dir(e6data_grpc))
+        with self.assertRaises(AttributeError):
+            e6data_grpc.UNKNOWN_TYPE
+
+
+class TestParseTimestamp(unittest.TestCase):
+    """Test the timestamp parser used for TIMESTAMP result values."""
+
+    def test_canonical_and_generic_shapes(self):
+        import datetime
+        from e6data_python_connector.e6data_grpc import _parse_timestamp
+        self.assertEqual(_parse_timestamp('2024-01-31 12:34:56'), datetime.datetime(2024, 1, 31, 12, 34, 56))
+        self.assertEqual(_parse_timestamp('2024-01-31 12:34:56.5'), datetime.datetime(2024, 1, 31, 12, 34, 56, 500000))
+        self.assertEqual(_parse_timestamp('2024-01-31 12:34:56.1234567'),
+                         datetime.datetime(2024, 1, 31, 12, 34, 56, 123456))
+        self.assertEqual(_parse_timestamp('2024-1-5 3:04:05'), datetime.datetime(2024, 1, 5, 3, 4, 5))
+        self.assertIsNone(_parse_timestamp(''))
+        with self.assertRaises(ValueError):
+            _parse_timestamp('2024-02-30 00:00:00')
+        with self.assertRaises(Exception):
+            _parse_timestamp('not a timestamp')
+
+
+class TestIsoDateFormatting(unittest.TestCase):
+    """Test the epoch-micros ISO formatters used for DATE/DATETIME columns."""
+
+    def test_rows_on_one_day_reuse_the_date_string(self):
+        import pytz
+        from e6data_python_connector import date_time_utils
+        date_time_utils._format_iso_date_from_days.cache_clear()
+        day = 1770854400000000
+        self.assertEqual(date_time_utils.format_iso_date_from_epoch_micros(day), '2026-02-12')
+        self.assertEqual(date_time_utils.format_iso_datetime_from_epoch_micros(day + 3723123456, tz=pytz.UTC),
+                         '2026-02-12T01:02:03.123+00:00')
+        self.assertEqual(date_time_utils.format_iso_datetime_from_epoch_micros(day, tz=pytz.FixedOffset(-60)),
+                         '2026-02-11T23:00:00.000-01:00')
+        self.assertEqual(date_time_utils.format_iso_date_from_epoch_micros(308847859200000000), '+11756-12-31')
+        info = date_time_utils._format_iso_date_from_days.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 3))
+
+
+class TestSharedChannels(unittest.TestCase):
+    """Test channels shared between connections with the share_channels option."""
+
+    @patch('e6data_python_connector.e6data_grpc.grpc.insecure_channel')
+    def test_connections_share_and_release_channels(self, insecure_channel):
+        from e6data_python_connector.e6data_grpc import Connection, _shared_channels
+        insecure_channel.side_effect = lambda target, options: MagicMock()
+
+        def connect(**grpc_options):
+            return Connection(host='shared-engine', port=80, username='user', password='token',
+                              grpc_options=dict(share_channels=True, **grpc_options), require_fastbinary=False)
+
+        first, second = connect(), connect()
+        other = connect(keepalive_time_ms=1000)
+        self.assertIs(first._channel, second._channel)
+        self.assertIsNot(first._channel, other._channel)
+        self.assertEqual(insecure_channel.call_count, 2)
+
+        channel = first._channel
+        first.close()
+        channel.close.assert_not_called()
+        second.close()
+        channel.close.assert_called_once()
+        other.close()
+        self.assertFalse([key for key in _shared_channels if key[0] == 'shared-engine:80'])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,600 @@
+"""
+Unit tests for Cursor fetch paths, driven by an in-memory fake gRPC stub.
+
+Result batches are real Thrift-encoded chunks, so these tests exercise the same
+decode path as a live e6data engine without needing network access.
+"""
+
+import asyncio
+import struct
+import unittest
+from concurrent.futures import Future
+from io import BytesIO
+from types import SimpleNamespace
+from unittest import mock
+
+import grpc
+from grpc._channel import _InactiveRpcError
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TTransport
+
+from e6data_python_connector.datainputstream import (
+    get_column_from_chunk, get_query_columns_info, iter_rows_from_columns, read_rows_from_chunk,
+    read_rows_from_chunk_iter, rows_from_columns
+)
+from e6data_python_connector import e6data_grpc
+from e6data_python_connector.constants import GRPC_ERROR_ACCESS_DENIED
+from e6data_python_connector.e6data_grpc import Cursor, _cleanup_query_strategy, _register_query_strategy
+from e6data_python_connector.e6x_vector.ttypes import (
+    BoolConstantData, Chunk, Data, DateConstantData, DateData, Int64Data, VarcharData, Vector, VectorType
+)
+
+
+def _utf(value):
+    encoded = value.encode()
+    return struct.pack('>H', len(encoded)) + encoded
+
+
+def encode_metadata(rowcount, columns):
+    """Encode a resultMetaData payload for ``[(name, field_type), ...]``."""
+    payload = struct.pack('>q', rowcount) + struct.pack('>i', len(columns))
+    for name, field_type in columns:
+        payload += _utf(name) + _utf(field_type) + _utf('UTC') + _utf('')
+    return payload
+
+
+def encode_chunk(ids, names):
+    """Encode a Thrift chunk with a LONG ``id`` column and a STRING ``name`` column."""
+    size = len(ids)
+    chunk = Chunk(size=size, vectors=[
+        Vector(size=size, vectorType=VectorType.LONG, nullSet=[value is None for value in ids],
+               data=Data(int64Data=Int64Data(data=[value or 0 for value in ids])), isConstantVector=False),
+        Vector(size=size, vectorType=VectorType.STRING, nullSet=[value is None for value in names],
+               data=Data(varcharData=VarcharData(data=[value or '' for value in names])), isConstantVector=False),
+    ])
+    transport = TTransport.TMemoryBuffer()
+    chunk.write(TBinaryProtocol.TBinaryProtocol(transport))
+    return transport.getvalue()
+
+
+class AccessDeniedError(_InactiveRpcError):
+    """What a blocking call raises when the server rejects an expired session."""
+
+    def __init__(self):
+        pass
+
+    def code(self):
+        return grpc.StatusCode.INTERNAL
+
+    def details(self):
+        return GRPC_ERROR_ACCESS_DENIED
+
+
+class FailedFutureError(grpc.RpcError):
+    """Stands in for the rendezvous a failed ``.future`` call raises from ``result()``."""
+
+    def code(self):
+        return grpc.StatusCode.INTERNAL
+
+    def details(self):
+        return GRPC_ERROR_ACCESS_DENIED
+
+
+class FakeUnaryCall(object):
+    """Mimics a grpc unary-unary callable, including its ``.future`` variant."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def __call__(self, request, metadata=None):
+        self.requests.append(request)
+        return self.handler(request)
+
+    def future(self, request, metadata=None):
+        self.requests.append(request)
+        future = Future()
+        try:
+            future.set_result(self.handler(request))
+        except grpc.RpcError as e:
+            future.set_exception(e)
+        return future
+
+
+class FakeStub(object):
+    """Serves a fixed list of encoded batches, followed by an empty batch."""
+
+    def __init__(self, batches, columns=(('id', 'LONG'), ('name', 'STRING'))):
+        self.batches = list(batches)
+        self.metadata = encode_metadata(sum(len(ids) for ids, _ in self.batches), list(columns))
+        self.calls = []
+        self.explain_analyze_requests = []
+        self.getNextResultBatch = FakeUnaryCall(self._next_result_batch)
+        self.getResultMetadata = FakeUnaryCall(self._result_metadata)
+        self.status = FakeUnaryCall(lambda request: SimpleNamespace(status=True, new_strategy=''))
+
+    def _next_result_batch(self, request):
+        self.calls.append('getNextResultBatch')
+        batch = encode_chunk(*self.batches.pop(0)) if self.batches else b''
+        return SimpleNamespace(resultBatch=batch, new_strategy='')
+
+    def prepareStatementV2(self, request, metadata=None, timeout=None):
+        self.calls.append('prepareStatementV2')
+        return SimpleNamespace(queryId='query', engineIP='engine', new_strategy='')
+
+    def executeStatementV2(self, request, metadata=None):
+        self.calls.append('executeStatementV2')
+        return SimpleNamespace(new_strategy='')
+
+    def prepareStatement(self, request, metadata=None):
+        self.calls.append('prepareStatement')
+        return SimpleNamespace(queryId='query', engineIP='engine', new_strategy='')
+
+    def executeStatement(self, request, metadata=None):
+        self.calls.append('executeStatement')
+        return SimpleNamespace(new_strategy='')
+
+    def explain(self, request, metadata=None):
+        self.calls.append('explain')
+        return SimpleNamespace(explain='plan')
+
+    def explainAnalyze(self, request, metadata=None):
+        self.calls.append('explainAnalyze')
+        self.explain_analyze_requests.append(request)
+        return SimpleNamespace(isCached=False, parsingTime=1, queueingTime=2, explainAnalyze='{}', new_strategy='')
+
+    def _result_metadata(self, request):
+        self.calls.append('getResultMetadata')
+        return SimpleNamespace(resultMetaData=self.metadata, new_strategy='')
+
+
+class FakeConnection(object):
+    database = 'db'
+    catalog_name = 'catalog'
+    cluster_name = None
+    get_session_id = 'session'
+    grpc_prepare_timeout = 600
+
+    def __init__(self, stub, prefetch_batches=1):
+        self.client = stub
+        self.prefetch_batches = prefetch_batches
+
+    def acquire_client(self):
+        return self.client
+
+
+def make_cursor(batches, prefetch_batches=1):
+    stub = FakeStub(batches)
+    cursor = Cursor(FakeConnection(stub, prefetch_batches))
+    cursor._query_id = 'query'
+    cursor.update_mete_data()
+    return cursor, stub
+
+
+class TestResultMetadata(unittest.TestCase):
+
+    def test_get_query_columns_info_accepts_bytes_and_streams(self):
+        payload = encode_metadata(7, [('id', 'LONG'), ('naïve', 'STRING')])
+        for buffer in (payload, memoryview(payload), BytesIO(payload)):
+            rowcount, columns = get_query_columns_info(buffer)
+            self.assertEqual(rowcount, 7)
+            self.assertEqual([(col.get_name(), col.get_field_type()) for col in columns],
+                             [('id', 'LONG'), ('naïve', 'STRING')])
+
+    def test_rowcount_reuses_fetched_metadata(self):
+        cursor, stub = make_cursor([([1, 2], ['a', 'b'])])
+        self.assertEqual(cursor.rowcount, 2)
+        self.assertEqual(cursor.rowcount, 2)
+        self.assertEqual(stub.calls.count('getResultMetadata'), 1)
+
+    def test_rowcount_fetches_metadata_after_execute(self):
+        stub = FakeStub([([1, 2, 3], ['a', 'b', 'c'])])
+        cursor = Cursor(FakeConnection(stub))
+        cursor.execute('select id, name from t')
+        self.assertEqual(cursor.rowcount, 3)
+        self.assertEqual(cursor.rowcount, 3)
+        self.assertEqual(stub.calls.count('getResultMetadata'), 1)
+
+
+class TestColumnDecode(unittest.TestCase):
+
+    def test_constant_vector_is_repeated(self):
+        vector = Vector(size=3, vectorType=VectorType.DATE, nullSet=[False], isConstantVector=True,
+                        data=Data(dateConstantData=DateConstantData(data=86400000000)))
+        self.assertEqual(get_column_from_chunk(vector), ['1970-01-02'] * 3)
+        vector.nullSet = [True]
+        self.assertEqual(get_column_from_chunk(vector), [None] * 3)
+
+    def test_null_set_is_applied(self):
+        vector = Vector(size=3, vectorType=VectorType.LONG, nullSet=[False, True, False], isConstantVector=False,
+                        data=Data(int64Data=Int64Data(data=[1, 0, 3])))
+        self.assertEqual(get_column_from_chunk(vector), [1, None, 3])
+
+    def test_null_set_is_applied_to_converted_column(self):
+        vector = Vector(size=3, vectorType=VectorType.DATE, nullSet=[True, False, True], isConstantVector=False,
+                        data=Data(dateData=DateData(data=[0, 86400000000, 0])))
+        self.assertEqual(get_column_from_chunk(vector), [None, '1970-01-02', None])
+
+    def test_plain_column_types_use_their_data_fields(self):
+        vector = Vector(size=2, vectorType=VectorType.MAP, nullSet=[True, False], isConstantVector=False,
+                        data=Data(varcharData=VarcharData(data=['', '{"a": 1}'])))
+        self.assertEqual(get_column_from_chunk(vector), [None, '{"a": 1}'])
+        vector = Vector(size=2, vectorType=VectorType.BOOLEAN, nullSet=[False], isConstantVector=True,
+                        data=Data(boolConstantData=BoolConstantData(data=True)))
+        self.assertEqual(get_column_from_chunk(vector), [True, True])
+
+    def test_short_plain_column_keeps_decoded_rows(self):
+        for vector_type in (VectorType.STRING, VectorType.BINARY, VectorType.STRUCT):
+            vector = Vector(size=3, vectorType=vector_type, nullSet=[False, True, False], isConstantVector=False,
+                            data=Data(varcharData=VarcharData(data=['a', ''])))
+            self.assertEqual(get_column_from_chunk(vector), ['a', None, 'Failed to parse.'])
+
+    def test_short_vector_is_padded(self):
+        vector = Vector(size=3, vectorType=VectorType.LONG, nullSet=[False, False, False], isConstantVector=False,
+                        data=Data(int64Data=Int64Data(data=[1, 2])))
+        self.assertEqual(get_column_from_chunk(vector), [1, 2, 'Failed to parse.'])
+        vector.nullSet = [True, False]
+        vector.data.int64Data.data = [0, 2, 3]
+        self.assertEqual(get_column_from_chunk(vector), [None, 2, 'Failed to parse.'])
+
+
+class TestRowsFromChunk(unittest.TestCase):
+
+    def test_unhandled_vector_type_keeps_every_row(self):
+        chunk = Chunk(size=3, vectors=[
+            Vector(size=3, vectorType=VectorType.LONG, nullSet=[False] * 3, isConstantVector=False,
+                   data=Data(int64Data=Int64Data(data=[1, 2, 3]))),
+            Vector(size=3, vectorType=VectorType.INT96, nullSet=[False] * 3, isConstantVector=False, data=Data()),
+        ])
+        transport = TTransport.TMemoryBuffer()
+        chunk.write(TBinaryProtocol.TBinaryProtocol(transport))
+        self.assertEqual(read_rows_from_chunk(['id', 'ts'], transport.getvalue()), [[1, None], [2, None], [3, None]])
+
+    def test_unequal_columns_are_rejected(self):
+        with self.assertRaises(IndexError):
+            rows_from_columns([[1, 2, 3], [None]])
+        with self.assertRaises(IndexError):
+            list(iter_rows_from_columns([[1, 2, 3], [None]]))
+
+
+class TestFetchColumnar(unittest.TestCase):
+
+    def test_fetch_columnar_returns_all_columns(self):
+        cursor, _ = make_cursor([([1, 2], ['a', 'b']), ([3], [None])])
+        self.assertEqual(cursor.fetch_columnar(), ([1, 2, 3], ['a', 'b', None]))
+
+    def test_fetch_columnar_keeps_overflow_for_next_fetch(self):
+        cursor, _ = make_cursor([([1, 2, 3], ['a', 'b', 'c'])])
+        self.assertEqual(cursor.fetch_columnar(2), ([1, 2], ['a', 'b']))
+        self.assertEqual(cursor.fetchmany(5), [[3, 'c']])
+
+    def test_fetch_columnar_drains_rows_buffered_by_fetchmany(self):
+        cursor, _ = make_cursor([([1, 2, 3], ['a', 'b', 'c']), ([4], ['d'])])
+        self.assertEqual(cursor.fetchmany(1), [[1, 'a']])
+        self.assertEqual(cursor.fetch_columnar(), ([2, 3, 4], ['b', 'c', 'd']))
+
+    def test_fetch_batch_returns_rows(self):
+        cursor, _ = make_cursor([([1, None], ['a', 'b'])])
+        self.assertEqual(cursor.fetch_batch(), [[1, 'a'], [None, 'b']])
+        self.assertIsNone(cursor.fetch_batch())
+
+
+class TestFetchMany(unittest.TestCase):
+
+    def test_fetchmany_consumes_buffer_in_order(self):
+        cursor, stub = make_cursor([([1, 2, 3, 4, 5], ['a', 'b', 'c', 'd', 'e'])])
+        self.assertEqual(cursor.fetchmany(2), [[1, 'a'], [2, 'b']])
+        self.assertEqual(cursor.fetchmany(2), [[3, 'c'], [4, 'd']])
+        self.assertEqual(cursor.fetchmany(2), [[5, 'e']])
+        self.assertEqual(cursor.fetchmany(2), [])
+
+    def test_fetch_more_stops_once_arraysize_rows_are_buffered(self):
+        cursor, stub = make_cursor([([1, 2], ['a', 'b']), ([3, 4], ['c', 'd']), ([5], ['e'])], prefetch_batches=0)
+        cursor.arraysize = 3
+        self.assertEqual(len(cursor._fetch_more()), 4)
+        self.assertEqual(stub.calls.count('getNextResultBatch'), 2)
+        self.assertEqual(cursor.fetchmany(), [[1, 'a'], [2, 'b'], [3, 'c']])
+
+
+class TestFetchOne(unittest.TestCase):
+
+    def test_fetchone_returns_single_rows_then_none(self):
+        cursor, stub = make_cursor([([1, 2], ['a', 'b']), ([3], ['c'])], prefetch_batches=0)
+        self.assertEqual(cursor.fetchone(), [1, 'a'])
+        self.assertEqual(cursor.fetchone(), [2, 'b'])
+        self.assertEqual(stub.calls.count('getNextResultBatch'), 1)
+        self.assertEqual(cursor.fetchone(), [3, 'c'])
+        self.assertIsNone(cursor.fetchone())
+
+    def test_fetchone_and_fetchmany_share_the_buffer(self):
+        cursor, _ = make_cursor([([1, 2, 3], ['a', 'b', 'c'])])
+        self.assertEqual(cursor.fetchone(), [1, 'a'])
+        self.assertEqual(cursor.fetchmany(5), [[2, 'b'], [3, 'c']])
+        self.assertIsNone(cursor.fetchone())
+
+    def test_cursor_iterates_rows(self):
+        cursor, _ = make_cursor([([1], ['a']), ([2], ['b'])])
+        self.assertEqual(list(cursor), [[1, 'a'], [2, 'b']])
+
+
+class TestFetchAllIter(unittest.TestCase):
+
+    def test_rows_are_yielded_lazily_across_batches(self):
+        cursor, stub = make_cursor([([1, 2], ['a', 'b']), ([3], ['c'])], prefetch_batches=0)
+        rows = cursor.fetchall_iter()
+        self.assertEqual(next(rows), [1, 'a'])
+        self.assertEqual(stub.calls.count('getNextResultBatch'), 1)
+        self.assertEqual(list(rows), [[2, 'b'], [3, 'c']])
+
+    def test_read_rows_from_chunk_iter_matches_list_decode(self):
+        chunk = encode_chunk([1, None], ['a', 'b'])
+        columns = [('id', 'LONG'), ('name', 'STRING')]
+        description = get_query_columns_info(encode_metadata(2, columns))[1]
+        self.assertEqual(list(read_rows_from_chunk_iter(description, chunk)),
+                         read_rows_from_chunk(description, chunk))
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def test_next_batch_is_requested_ahead_of_consumer(self):
+        cursor, stub = make_cursor([([1], ['a']), ([2], ['b'])])
+        self.assertEqual(cursor.fetch_batch(), [[1, 'a']])
+        self.assertEqual(stub.calls.count('getNextResultBatch'), 2)
+        self.assertEqual(cursor.fetch_batch(), [[2, 'b']])
+        self.assertIsNone(cursor.fetch_batch())
+
+    def test_execute_requests_first_batch_before_metadata(self):
+        stub = FakeStub([([1], ['a'])])
+        cursor = Cursor(FakeConnection(stub))
+        cursor.execute('select id, name from t')
+        self.assertEqual(stub.calls, ['prepareStatementV2', 'executeStatementV2',
+                                      'getNextResultBatch', 'getResultMetadata'])
+        self.assertEqual(cursor.fetchall(), [[1, 'a']])
+
+    def test_execute_without_catalog_uses_v1_statements(self):
+        stub = FakeStub([([1], ['a'])])
+        connection = FakeConnection(stub)
+        connection.catalog_name = None
+        cursor = Cursor(connection)
+        cursor.execute('select id, name from t;')
+        self.assertEqual(stub.calls[:2], ['prepareStatement', 'executeStatement'])
+        self.assertEqual(cursor.fetchall(), [[1, 'a']])
+
+    def test_metadata_started_by_execute_is_read_once(self):
+        stub = FakeStub([([1], ['a'])])
+        cursor = Cursor(FakeConnection(stub))
+        cursor.execute('select id, name from t')
+        self.assertEqual([col[0] for col in cursor.description], ['id', 'name'])
+        self.assertEqual(cursor.fetchall(), [[1, 'a']])
+        self.assertEqual(stub.calls.count('getResultMetadata'), 1)
+
+    def test_metadata_access_denied_is_retried_by_execute(self):
+        # The failed execute has already prefetched a batch; the retried one gets the second
+        stub = FakeStub([([0], ['stale']), ([1], ['a'])])
+        failures = [FailedFutureError(), AccessDeniedError()]
+        result_metadata = stub.getResultMetadata.handler
+
+        def handler(request):
+            if failures:
+                raise failures.pop(0)
+            return result_metadata(request)
+
+        stub.getResultMetadata.handler = handler
+        connection = FakeConnection(stub)
+        connection.get_re_authenticate_session_id = mock.Mock()
+        cursor = Cursor(connection)
+        with mock.patch.object(e6data_grpc.time, 'sleep'):
+            cursor.execute('select id, name from t')
+        connection.get_re_authenticate_session_id.assert_called_once_with()
+        self.assertEqual(stub.calls.count('executeStatementV2'), 2)
+        self.assertEqual(cursor.fetchall(), [[1, 'a']])
+
+    def test_failed_prefetch_is_raised_without_skipping_rows(self):
+        cursor, stub = make_cursor([([1], ['a']), ([2], ['b'])])
+        failures = [FailedFutureError()]
+        next_result_batch = stub.getNextResultBatch.handler
+
+        def handler(request):
+            if failures:
+                raise failures.pop(0)
+            return next_result_batch(request)
+
+        stub.getNextResultBatch.handler = handler
+        cursor._prefetch_next_batches()
+        with self.assertRaises(grpc.RpcError):
+            cursor.fetch_batch()
+        # The failed call is not re-issued behind the caller's back
+        self.assertEqual(len(stub.getNextResultBatch.requests), 1)
+        self.assertEqual(cursor.fetch_batch(), [[1, 'a']])
+        self.assertEqual(cursor.fetch_batch(), [[2, 'b']])
+
+    def test_prefetch_stops_after_last_batch(self):
+        cursor, stub = make_cursor([([1], ['a'])], prefetch_batches=3)
+        self.assertEqual(cursor.fetchall(), [[1, 'a']])
+        self.assertEqual(stub.calls.count('getNextResultBatch'), 2)
+
+    def test_prefetch_disabled(self):
+        cursor, stub = make_cursor([([1], ['a']), ([2], ['b'])], prefetch_batches=0)
+        cursor.fetch_batch()
+        self.assertEqual(stub.calls.count('getNextResultBatch'), 1)
+
+    def test_cancel_prefetch_discards_pending_batches(self):
+        cursor, stub = make_cursor([([1], ['a']), ([2], ['b'])])
+        cursor.fetch_batch()
+        cursor._cancel_prefetch()
+        self.assertFalse(cursor._prefetch_futures)
+
+
+class TestAsyncFetch(unittest.TestCase):
+
+    def test_execute_and_fetch_from_coroutines(self):
+        async def run(cursor):
+            query_id = await cursor.execute_async('select id, name from t')
+            rows = await cursor.fetchall_async()
+            return query_id, rows, await cursor.fetchmany_async(1)
+
+        cursors = [Cursor(FakeConnection(FakeStub([([1, 2], ['a', 'b'])]))) for _ in range(3)]
+
+        async def gather():
+            return await asyncio.gather(*(run(cursor) for cursor in cursors))
+
+        for query_id, rows, rest in asyncio.run(gather()):
+            self.assertEqual(query_id, 'query')
+            self.assertEqual(rows, [[1, 'a'], [2, 'b']])
+            self.assertEqual(rest, [])
+
+
+class TestRequestReuse(unittest.TestCase):
+
+    def test_batch_request_is_built_once_per_query(self):
+        cursor, stub = make_cursor([([1], ['a']), ([2], ['b'])])
+        cursor.fetchall()
+        requests = stub.getNextResultBatch.requests
+        self.assertEqual(len(requests), 3)
+        self.assertTrue(all(request is requests[0] for request in requests))
+        self.assertEqual(requests[0].queryId, 'query')
+
+
+class TestExplainCache(unittest.TestCase):
+
+    def test_explain_is_fetched_once_per_query(self):
+        cursor, stub = make_cursor([([1], ['a'])])
+        self.assertEqual(cursor.explain(), 'plan')
+        self.assertEqual(cursor.explain(), 'plan')
+        self.assertEqual(stub.calls.count('explain'), 1)
+
+    def test_explain_analyse_is_cached_after_results_are_exhausted(self):
+        cursor, stub = make_cursor([([1], ['a'])])
+        cursor.explain_analyse()
+        cursor.explain_analyse()
+        self.assertEqual(stub.calls.count('explainAnalyze'), 2)
+        cursor.fetchall()
+        first = cursor.explain_analyse()
+        first['planner'] = 'changed'
+        self.assertEqual(cursor.explain_analyse()['planner'], '{}')
+        self.assertEqual(stub.calls.count('explainAnalyze'), 3)
+
+    def test_explain_analyse_reuses_its_request_while_polling(self):
+        cursor, stub = make_cursor([([1], ['a'])])
+        cursor.explain_analyse()
+        cursor.explain_analyse()
+        first, second = stub.explain_analyze_requests
+        self.assertIs(first, second)
+        self.assertEqual(first.queryId, 'query')
+
+
+class TestSessionId(unittest.TestCase):
+
+    def test_session_id_is_resolved_once_per_query(self):
+        class CountingConnection(FakeConnection):
+            lookups = 0
+
+            @property
+            def get_session_id(self):
+                CountingConnection.lookups += 1
+                return 'session'
+
+        cursor = Cursor(CountingConnection(FakeStub([([1], ['a']), ([2], ['b'])])))
+        cursor._query_id = 'query'
+        cursor.update_mete_data()
+        self.assertEqual(cursor.fetchall(), [[1, 'a'], [2, 'b']])
+        self.assertEqual(CountingConnection.lookups, 1)
+
+    def test_description_entries(self):
+        cursor, _ = make_cursor([([1], ['a'])])
+        self.assertEqual(cursor.description, [('id', 'LONG', None, None, None, None, True),
+                                              ('name', 'STRING', None, None, None, None, True)])
+
+    def test_status_request_is_reused_while_polling(self):
+        cursor, stub = make_cursor([([1], ['a'])])
+        cursor.status('query')
+        cursor.status('query')
+        cursor.status('other')
+        first, second, third = stub.status.requests
+        self.assertIs(first, second)
+        self.assertEqual(third.queryId, 'other')
+
+    def test_update_mete_data_reads_metadata_once_per_query(self):
+        cursor, stub = make_cursor([([1], ['a'])])
+        cursor.update_mete_data()
+        self.assertEqual(cursor.rowcount, 1)
+        self.assertEqual(stub.calls.count('getResultMetadata'), 1)
+
+
+class TestGrpcHeader(unittest.TestCase):
+
+    def setUp(self):
+        _register_query_strategy('query', 'blue')
+        self.addCleanup(_cleanup_query_strategy, 'query')
+
+    def test_header_is_built_once_per_query(self):
+        with mock.patch.object(e6data_grpc, '_get_grpc_header_tuple', wraps=e6data_grpc._get_grpc_header_tuple) as build:
+            cursor, stub = make_cursor([([1], ['a']), ([2], ['b'])])
+            self.assertEqual(cursor.fetchall(), [[1, 'a'], [2, 'b']])
+            self.assertEqual(cursor.metadata, (('strategy', 'blue'),))
+        self.assertEqual(build.call_count, 1)
+
+    def test_header_is_rebuilt_after_invalidation(self):
+        cursor, stub = make_cursor([([1], ['a'])])
+        header = cursor.metadata
+        self.assertIs(cursor.metadata, header)
+        cursor._invalidate_metadata()
+        self.assertIsNone(cursor._grpc_header)
+        self.assertEqual(cursor.metadata, header)
+        cursor._engine_ip = 'engine'
+        self.assertEqual(cursor.metadata, (('plannerip', 'engine'), ('strategy', 'blue')))
+
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+class TestFetchArrow(unittest.TestCase):
+
+    def test_fetch_arrow_builds_typed_table(self):
+        cursor, _ = make_cursor([([1, None], ['a', 'b'])])
+        table = cursor.fetch_arrow()
+        self.assertEqual(table.column_names, ['id', 'name'])
+        self.assertEqual(table.schema.field('id').type, pyarrow.int64())
+        self.assertEqual(table.column('id').to_pylist(), [1, None])
+
+    def test_fetch_arrow_batches_yields_buffered_rows_then_batches(self):
+        cursor, _ = make_cursor([([1, 2], ['a', 'b']), ([3], ['c'])])
+        cursor.fetchmany(1)
+        batches = list(cursor.fetch_arrow_batches())
+        self.assertEqual([batch.to_pylist() for batch in batches], [
+            [{'id': 2, 'name': 'b'}],
+            [{'id': 3, 'name': 'c'}],
+        ])
+        self.assertEqual(batches[1].schema.field('id').type, pyarrow.int64())
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(numpy, 'numpy is not installed')
+class TestFetchNumpy(unittest.TestCase):
+
+    def test_fetch_numpy_builds_typed_and_masked_arrays(self):
+        cursor, _ = make_cursor([([1, 2], ['a', 'b'])])
+        ids, names = cursor.fetch_numpy()
+        self.assertEqual(ids.dtype, numpy.int64)
+        self.assertNotIsInstance(ids, numpy.ma.MaskedArray)
+        self.assertEqual(names.dtype, object)
+        self.assertEqual(names.tolist(), ['a', 'b'])
+
+        cursor, _ = make_cursor([([1, None], ['a', None])])
+        ids, names = cursor.fetch_numpy()
+        self.assertIsInstance(ids, numpy.ma.MaskedArray)
+        self.assertEqual(ids.tolist(), [1, None])
+        self.assertEqual(names.tolist(), ['a', None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,9 +68,10 @@ class TestE6X(TestCase):
         query_id = cursor.execute(sql)
         logging.debug('Query Id {}'.format(query_id))
         self.assertIsNotNone(query_id)
-        records = cursor.fetchone()
+        record = cursor.fetchone()
+        column_count = len(cursor.description)
         cursor.clear()
-        self.assertEqual(1, len(records))
+        self.assertEqual(column_count, len(record))
         self.e6x_connection.close()
 
     def test_query_4_fetch_many(self):